@@ -0,0 +1,2 @@
+# Folder repo masuk sys.path saat pytest dijalankan (import core.*), juga
+# tanpa "python -m pytest"
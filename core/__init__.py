@@ -0,0 +1 @@
+# Modul bersama untuk inference aduan (dipakai oleh halaman di views/)
@@ -0,0 +1,324 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+from core import metrics, pipeline
+
+DEFAULT_CSV = "source/data-20rb.csv"
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_SINGLE = 300
+CHUNK_SIZE = 4096
+# Modul berat yang tidak boleh ikut ter-import sebelum beranda tampil
+ML_MODULES = ("pandas", "scipy", "sklearn", "xgboost", "joblib", "matplotlib", "wordcloud", "nltk", "Sastrawi")
+
+
+# ====== DATA BENCHMARK ======
+def load_texts(csv_path, column="text"):
+    path = pipeline.resolve_path(csv_path)
+    if os.path.exists(path):
+        import pandas as pd
+        return pd.read_csv(path, usecols=[column])[column].dropna().astype(str).tolist()
+    from core.loadgen import SAMPLE_TEXTS
+    print(f"[bench] {csv_path} tidak ada, memakai teks contoh core.loadgen", file=sys.stderr)
+    return list(SAMPLE_TEXTS)
+
+
+# Perbesar dataset ke n baris: ambil acak, acak urutan kata dan kadang buang
+# satu kata, jadi sebagian besar baris unik tapi kosakatanya tetap realistis
+def scale_texts(texts, n, seed=0):
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        words = rng.choice(texts).split()
+        if len(words) > 3:
+            rng.shuffle(words)
+            if rng.random() < 0.5:
+                words.pop(rng.randrange(len(words)))
+        out.append(" ".join(words))
+    return out
+
+
+def _summary_ms(seconds):
+    import numpy as np
+    ms = np.asarray(seconds) * 1000
+    return {
+        "mean": round(float(ms.mean()), 3),
+        "p50": round(float(np.percentile(ms, 50)), 3),
+        "p95": round(float(np.percentile(ms, 95)), 3),
+        "p99": round(float(np.percentile(ms, 99)), 3),
+    }
+
+
+# ====== PENGUKURAN (dijalankan di proses anak) ======
+# Cache token Normalizer & cache stem dikosongkan sebelum tiap pengukuran batch,
+# dan pool worker preprocessing ditutup (cache stem tiap worker ikut hilang),
+# supaya tahap/ujung-ke-ujung sama-sama mulai dingin seperti upload baru
+def _reset_caches():
+    from core import parallel, registry
+    parallel.shutdown()
+    registry.get_normalizer()._run_tokens.cache_clear()
+    if registry.get_spec()["stem"]:
+        registry.get_stemmer().clear()
+
+
+def _cold_start(t_start):
+    t0 = time.perf_counter()
+    from core import registry
+    from core.inference import predict_text
+    t1 = time.perf_counter()
+    registry.warm_up()
+    t2 = time.perf_counter()
+    predict_text("jalan rusak parah di depan pasar", use_cache=False)
+    t3 = time.perf_counter()
+    return {
+        "import_s": round(t1 - t0, 3),
+        "warm_up_s": round(t2 - t1, 3),
+        "first_predict_s": round(t3 - t2, 3),
+        "in_process_s": round(t3 - t_start, 3),
+        "peak_rss_mb": metrics.peak_rss_mb(),
+    }
+
+
+# Waktu sampai halaman beranda (main.py, page=about) selesai digambar,
+# diukur dengan streamlit AppTest; runtime Streamlit dipanaskan dulu dengan
+# skrip kosong supaya yang terukur hanya skrip aplikasi
+def _first_paint():
+    from streamlit.testing.v1 import AppTest
+
+    AppTest.from_string("import streamlit as st\nst.write('')").run()
+    before = set(sys.modules)
+    t0 = time.perf_counter()
+    at = AppTest.from_file(os.path.join(pipeline.BASE_DIR, "main.py"), default_timeout=120).run()
+    elapsed = time.perf_counter() - t0
+    return {
+        "first_paint_s": round(elapsed, 3),
+        "errors": [str(e.value) for e in at.exception],
+        "ml_modules_loaded": [m for m in ML_MODULES if m in sys.modules and m not in before],
+    }
+
+
+def _single(texts, n):
+    from core import registry
+    from core.inference import predict_text
+    from core.preprocess import preprocess_tokens
+
+    registry.warm_up()
+    normalizer = registry.get_normalizer()
+    stemmer = registry.get_stemmer() if registry.get_spec()["stem"] else None
+    index = registry.get_keyword_index()
+    model = registry.get_xgb_model()
+    texts = scale_texts(texts, n, seed=1)
+
+    stages = {"preprocess": [], "features": [], "predict": [], "total": []}
+    for text in texts:
+        t0 = time.perf_counter()
+        tokens = [preprocess_tokens(text, normalizer, stemmer)]
+        t1 = time.perf_counter()
+        X, _ = index.transform(tokens)
+        t2 = time.perf_counter()
+        model.predict_proba(X)
+        t3 = time.perf_counter()
+        stages["preprocess"].append(t1 - t0)
+        stages["features"].append(t2 - t1)
+        stages["predict"].append(t3 - t2)
+    for text in texts:
+        t0 = time.perf_counter()
+        predict_text(text, use_cache=False)
+        stages["total"].append(time.perf_counter() - t0)
+    return {
+        "texts": n,
+        "latency_ms": {k: _summary_ms(v) for k, v in stages.items()},
+        "peak_rss_mb": metrics.peak_rss_mb(),
+    }
+
+
+def _batch(texts, size, workers):
+    from core import parallel, registry
+    from core.inference import predict_batch
+    from core.parallel import preprocess_parallel
+
+    registry.warm_up()
+    rss_ready = metrics.peak_rss_mb()
+    index = registry.get_keyword_index()
+    model = registry.get_xgb_model()
+    texts = scale_texts(texts, size, seed=2)
+
+    _reset_caches()
+    t0 = time.perf_counter()
+    tokens = preprocess_parallel(texts, workers=workers)
+    t1 = time.perf_counter()
+    mats = [index.transform(tokens[i:i + CHUNK_SIZE])[0] for i in range(0, size, CHUNK_SIZE)]
+    t2 = time.perf_counter()
+    for X in mats:
+        model.predict_proba(X)
+    t3 = time.perf_counter()
+    del tokens, mats
+
+    # Ujung ke ujung seperti halaman input (termasuk dedupe per batch, tanpa result cache)
+    _reset_caches()
+    t4 = time.perf_counter()
+    predict_batch(texts, workers=workers, use_cache=False)
+    t5 = time.perf_counter()
+    parallel.shutdown()
+
+    stages = {"preprocess": t1 - t0, "features": t2 - t1, "predict": t3 - t2}
+    return {
+        "rows": size,
+        "unique_texts": len(set(texts)),
+        "workers": workers,
+        "stages_s": {k: round(v, 3) for k, v in stages.items()},
+        "stages_rows_per_s": {k: round(size / v) if v else None for k, v in stages.items()},
+        "end_to_end_s": round(t5 - t4, 3),
+        "rows_per_s": round(size / (t5 - t4)),
+        "rss_ready_mb": rss_ready,
+        "peak_rss_mb": metrics.peak_rss_mb(),
+        "peak_rss_worker_mb": metrics.peak_rss_mb(children=True),
+        "stem_cache": parallel.stem_cache_stats(),
+    }
+
+
+def _child(args, t_start):
+    if args.child == "cold":
+        result = _cold_start(t_start)
+    elif args.child == "paint":
+        result = _first_paint()
+    else:
+        texts = load_texts(args.csv, args.column)
+        if args.child == "single":
+            result = _single(texts, args.single)
+        else:
+            result = _batch(texts, args.size, args.workers)
+    print(json.dumps(result))
+
+
+# ====== ORKESTRASI (tiap ukuran di proses baru -> peak RSS & cold start bersih) ======
+def _run_child(kind, args, size=None):
+    cmd = [sys.executable, "-m", "core.bench", "--child", kind, "--csv", args.csv,
+           "--column", args.column, "--single", str(args.single)]
+    if size is not None:
+        cmd += ["--size", str(size)]
+    if args.workers is not None:
+        cmd += ["--workers", str(args.workers)]
+    env = dict(os.environ)
+    if not args.warm_caches:
+        # Cache stem/hasil di disk membuat angka tergantung run sebelumnya
+        env["ADUAN_STEM_CACHE"] = ""
+        env["ADUAN_RESULT_CACHE"] = ""
+    t0 = time.perf_counter()
+    out = subprocess.run(
+        cmd, cwd=pipeline.BASE_DIR, env=env, check=True, capture_output=True, text=True
+    ).stdout
+    result = json.loads(out.strip().splitlines()[-1])
+    if kind == "cold":
+        # Termasuk start interpreter sampai prediksi pertama selesai
+        result["total_s"] = round(time.perf_counter() - t0, 3)
+    return result
+
+
+def _environment():
+    import numpy
+    import xgboost
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=pipeline.BASE_DIR,
+            capture_output=True, text=True
+        ).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": numpy.__version__,
+        "xgboost": xgboost.__version__,
+        "git_commit": commit,
+        "pipeline_version": pipeline.load_spec()["version"],
+    }
+
+
+def run_suite(args):
+    results = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": _environment(),
+        "dataset": args.csv,
+        "cold_start": _run_child("cold", args),
+        "first_paint": _run_child("paint", args),
+        "single": _run_child("single", args),
+        "batch": [],
+    }
+    for size in args.sizes:
+        print(f"[bench] batch {size:,} baris...", file=sys.stderr)
+        results["batch"].append(_run_child("batch", args, size))
+    return results
+
+
+# Rasio baru/lama untuk angka utama (>1 berarti lebih cepat untuk throughput)
+def compare(old, new):
+    lines = []
+
+    def row(name, a, b, higher_is_better):
+        if not a or not b:
+            return
+        ratio = b / a if higher_is_better else a / b
+        lines.append(f"  {name:<32} {a:>12,.3f} -> {b:>12,.3f}  ({ratio:.2f}x)")
+
+    row("cold start total_s", old["cold_start"]["total_s"], new["cold_start"]["total_s"], False)
+    if "first_paint" in old:
+        row("beranda first_paint_s", old["first_paint"]["first_paint_s"],
+            new["first_paint"]["first_paint_s"], False)
+    row("single total p50 ms", old["single"]["latency_ms"]["total"]["p50"],
+        new["single"]["latency_ms"]["total"]["p50"], False)
+    old_batch = {b["rows"]: b for b in old["batch"]}
+    for b in new["batch"]:
+        o = old_batch.get(b["rows"])
+        if o:
+            row(f"batch {b['rows']:,} rows/s", o["rows_per_s"], b["rows_per_s"], True)
+            row(f"batch {b['rows']:,} peak MB", o["peak_rss_mb"], b["peak_rss_mb"], False)
+            row(f"batch {b['rows']:,} worker peak MB", o.get("peak_rss_worker_mb"),
+                b.get("peak_rss_worker_mb"), False)
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    t_start = time.perf_counter()
+    parser = argparse.ArgumentParser(description="Benchmark pipeline klasifikasi aduan")
+    parser.add_argument("--csv", default=DEFAULT_CSV)
+    parser.add_argument("--column", default="text")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="ukuran batch sintetis, mis. 1000,10000,100000,1000000")
+    parser.add_argument("--single", type=int, default=DEFAULT_SINGLE, help="jumlah teks jalur satu teks")
+    parser.add_argument("--workers", type=int, help="proses preprocessing (default: ADUAN_PREPROCESS_WORKERS/cpu)")
+    parser.add_argument("--warm-caches", action="store_true", help="pakai cache stem/hasil di disk")
+    parser.add_argument("-o", "--output", help="file JSON hasil (default .cache/bench/<waktu>.json)")
+    parser.add_argument("--compare", metavar="JSON", help="bandingkan dengan hasil run sebelumnya")
+    parser.add_argument("--child", choices=("cold", "paint", "single", "batch"), help=argparse.SUPPRESS)
+    parser.add_argument("--size", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _child(args, t_start)
+        return
+
+    args.sizes = [int(s) for s in args.sizes.split(",") if s]
+    results = run_suite(args)
+    output = args.output or os.path.join(
+        pipeline.BASE_DIR, ".cache", "bench", time.strftime("%Y%m%d-%H%M%S") + ".json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(json.dumps(results, indent=2))
+    print(f"[bench] hasil disimpan di {output}", file=sys.stderr)
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            print(compare(json.load(f), results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import argparse
+import csv
+import itertools
+import json
+import sys
+import time
+
+from core import registry
+from core.inference import LABEL_NAMES, predict_batch, severity_scores
+from core.parallel import stem_cache_stats
+
+OUTPUT_COLUMNS = ("text", "text_cleaned", "prob_aduan", "severity", "label")
+DEFAULT_ROWS_PER_CHUNK = 20_000
+
+
+# ====== BACA INPUT PER CHUNK (memori konstan) ======
+def _fmt(path):
+    return "jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv"
+
+
+def _csv_chunks(f, column, rows):
+    import pandas as pd
+    for chunk in pd.read_csv(f, chunksize=rows, usecols=[column], dtype={column: str}):
+        yield chunk[column].fillna("").tolist()
+
+
+def _jsonl_chunks(f, column, rows):
+    lines = (line for line in f if line.strip())
+    while True:
+        block = list(itertools.islice(lines, rows))
+        if not block:
+            return
+        yield [str(json.loads(line).get(column) or "") for line in block]
+
+
+# ====== TULIS OUTPUT INKREMENTAL ======
+class _CsvSink:
+    def __init__(self, f):
+        self.writer = csv.writer(f)
+        self.writer.writerow(OUTPUT_COLUMNS)
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+
+
+class _JsonlSink:
+    def __init__(self, f):
+        self.f = f
+
+    def write(self, rows):
+        self.f.writelines(
+            json.dumps(dict(zip(OUTPUT_COLUMNS, r)), ensure_ascii=False) + "\n" for r in rows
+        )
+
+
+def _open(path, mode):
+    if path == "-":
+        return sys.stdin if "r" in mode else sys.stdout
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def classify_stream(src, dst, in_fmt, out_fmt, column="text",
+                    rows_per_chunk=DEFAULT_ROWS_PER_CHUNK, workers=None, progress=None, use_cache=False):
+    chunks = (_csv_chunks if in_fmt == "csv" else _jsonl_chunks)(src, column, rows_per_chunk)
+    sink = (_CsvSink if out_fmt == "csv" else _JsonlSink)(dst)
+    total, t0 = 0, time.perf_counter()
+    for texts in chunks:
+        cleaned, prob, label = predict_batch(texts, workers=workers, use_cache=use_cache)
+        severity = severity_scores(cleaned)
+        severity = [round(v, 3) for v in severity.tolist()] if severity is not None else [None] * len(texts)
+        sink.write(
+            (t, c, round(p, 6), v, LABEL_NAMES[l])
+            for t, c, p, v, l in zip(texts, cleaned, prob.tolist(), severity, label.tolist())
+        )
+        dst.flush()
+        total += len(texts)
+        if progress is not None:
+            progress(total, time.perf_counter() - t0)
+    return total, time.perf_counter() - t0
+
+
+def _print_progress(total, elapsed):
+    rate = total / elapsed if elapsed else 0.0
+    print(f"\r{total:,} baris | {elapsed:,.1f} s | {rate:,.0f} baris/s", end="", file=sys.stderr, flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Klasifikasi aduan untuk file CSV/JSONL besar secara streaming"
+    )
+    parser.add_argument("input", help="file CSV/JSONL, atau - untuk stdin")
+    parser.add_argument("-o", "--output", default="-", help="file CSV/JSONL hasil (default stdout)")
+    parser.add_argument("--input-format", choices=("csv", "jsonl"))
+    parser.add_argument("--output-format", choices=("csv", "jsonl"))
+    parser.add_argument("--column", default="text", help="nama kolom/field teks")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_ROWS_PER_CHUNK)
+    parser.add_argument("--workers", type=int, help="jumlah proses preprocessing")
+    parser.add_argument("--cache", action="store_true",
+                        help="pakai cache hasil prediksi (ke disk hanya bila ADUAN_RESULT_CACHE diisi)")
+    parser.add_argument("-q", "--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    in_fmt = args.input_format or _fmt(args.input)
+    out_fmt = args.output_format or _fmt(args.output)
+    registry.warm_up()
+    with _open(args.input, "r") as src, _open(args.output, "w") as dst:
+        total, elapsed = classify_stream(
+            src, dst, in_fmt, out_fmt, args.column, args.chunk_rows, args.workers,
+            None if args.quiet else _print_progress, args.cache,
+        )
+    if not args.quiet:
+        print(f"\nselesai: {total:,} baris dalam {elapsed:,.1f} s "
+              f"(pipeline {registry.get_spec()['version']})", file=sys.stderr)
+        stem = stem_cache_stats()
+        if stem is not None:
+            print(f"cache stem: hit rate {stem['hit_rate']:.1%} ({stem['hits']:,} hit, "
+                  f"{stem['misses']:,} miss)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+import contextvars
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from core import metrics
+
+PAGE_SIZE = 50
+WORDCLOUD_MAX_WORDS = 200
+WORDCLOUD_CACHE_SIZE = 32
+LABELS = ("aduan", "bukan aduan")
+
+# Grafik dibuat di thread terpisah supaya metric card & tabel langsung tampil;
+# halaman menunggu hasilnya (future) tepat di posisi grafik masing-masing.
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="dashboard")
+
+
+def submit(fn, *args):
+    # Trace upload (contextvar) ikut ke thread worker
+    return _executor.submit(contextvars.copy_context().run, fn, *args)
+
+
+# Artefak bisa berupa future (baru dihitung) atau nilai jadi (dari cache upload)
+def resolve(value):
+    return value.result() if isinstance(value, Future) else value
+
+
+# ====== RINGKASAN (metric card) ======
+def summary(df):
+    is_aduan = (df["label"] == "aduan").to_numpy()
+    return {
+        "total": len(df),
+        "aduan": int(is_aduan.sum()),
+        "bukan": int(len(df) - is_aduan.sum()),
+        "avg_words": int(df["text"].str.split().str.len().mean()) if len(df) else 0,
+    }
+
+
+# ====== FREKUENSI KATA DARI MATRIKS DOKUMEN-ISTILAH ======
+# text_cleaned sudah berupa token dipisah spasi, jadi cukup dipetakan ke indeks
+# istilah sekali (tanpa regex tokenisasi ulang seperti WordCloud.generate).
+# Kata 1 huruf diabaikan, sama seperti regexp bawaan WordCloud.
+def term_matrix(cleaned_texts):
+    vocab = {}
+    indices = []
+    indptr = [0]
+    for text in cleaned_texts:
+        indices.extend(vocab.setdefault(w, len(vocab)) for w in text.split() if len(w) > 1)
+        indptr.append(len(indices))
+    X = csr_matrix(
+        (np.ones(len(indices), dtype=np.int32), np.asarray(indices, dtype=np.int32),
+         np.asarray(indptr, dtype=np.int64)),
+        shape=(len(cleaned_texts), len(vocab)),
+    )
+    X.sum_duplicates()
+    terms = np.empty(len(vocab), dtype=object)
+    terms[list(vocab.values())] = list(vocab)
+    return X, terms
+
+
+def _top(counts, terms, top):
+    nz = np.flatnonzero(counts)
+    top_idx = nz[np.argsort(-counts[nz], kind="stable")[:top]]
+    return {terms[i]: int(counts[i]) for i in top_idx}
+
+
+# Semua label sekaligus: (one-hot label)^T @ X = jumlah kolom per label dalam
+# satu perkalian sparse, tanpa memotong X per label
+def label_frequencies(X, terms, labels, classes=LABELS, top=WORDCLOUD_MAX_WORDS):
+    labels = np.asarray(labels)
+    onehot = csr_matrix(np.stack([labels == c for c in classes]).astype(X.dtype))
+    counts = (onehot @ X).toarray()
+    return {c: _top(row, terms, top) for c, row in zip(classes, counts)}
+
+
+# ====== GAMBAR (PNG bytes, dibuat di worker) ======
+# Memakai Figure langsung (bukan pyplot) karena pyplot tidak aman dipakai dari thread lain
+def _png(fig):
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", bbox_inches="tight", dpi=100)
+    return buf.getvalue()
+
+
+def donut_png(n_aduan, n_bukan):
+    from matplotlib.figure import Figure
+    from matplotlib.patches import Circle
+
+    with metrics.timer("render.pie"):
+        fig = Figure(figsize=(3, 3))
+        ax = fig.subplots()
+        _, _, autotxt = ax.pie(
+            [n_aduan, n_bukan],
+            labels=["Aduan", "Bukan"],
+            autopct="%1.1f%%",
+            startangle=120,
+            colors=["#DE4C4A", "#A1D48F"],
+            explode=(0.05, 0.05),
+            wedgeprops={"edgecolor": "#fff", "linewidth": 1.5},
+            textprops={"fontsize": 12, "weight": "bold"}
+        )
+        for t in autotxt:
+            t.set_color("#333")
+        ax.add_artist(Circle((0, 0), 0.65, fc="white", linewidth=1.2, edgecolor="#ececec"))
+        ax.axis("equal")
+        return _png(fig)
+
+
+def wordcloud_png(freqs):
+    if not freqs:
+        return None
+    from wordcloud import WordCloud
+
+    with metrics.timer("render.wordcloud"):
+        wc = WordCloud(width=400, height=200, background_color="white",
+                       max_words=WORDCLOUD_MAX_WORDS).generate_from_frequencies(freqs)
+        buf = io.BytesIO()
+        wc.to_image().save(buf, format="PNG")
+        return buf.getvalue()
+
+
+# ====== CACHE GAMBAR WORDCLOUD PER DATASET ======
+# Kunci = hash isi (text_cleaned + label). Upload ulang / rerun dengan data
+# yang sama langsung memakai PNG lama tanpa menghitung layout WordCloud lagi.
+_wc_lock = threading.Lock()
+_wc_cache = OrderedDict()
+
+
+def dataset_hash(cleaned_texts, labels):
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{len(cleaned_texts)}|{WORDCLOUD_MAX_WORDS}".encode())
+    for text in cleaned_texts:
+        h.update(text.encode("utf-8"))
+        h.update(b"\x00")
+    h.update(np.packbits(np.asarray(labels) == LABELS[0]).tobytes())
+    return h.hexdigest()
+
+
+def wordcloud_pngs(cleaned_texts, labels):
+    with metrics.timer("render.wordcloud_hash", len(cleaned_texts)):
+        key = dataset_hash(cleaned_texts, labels)
+    with _wc_lock:
+        pngs = _wc_cache.get(key)
+        if pngs is not None:
+            _wc_cache.move_to_end(key)
+            metrics.inc("wordcloud_cache_hits")
+            return pngs
+
+    with metrics.timer("render.frequencies", len(cleaned_texts)):
+        X, terms = term_matrix(cleaned_texts)
+        freqs = label_frequencies(X, terms, labels)
+    pngs = {label: wordcloud_png(f) for label, f in freqs.items()}
+    with _wc_lock:
+        _wc_cache[key] = pngs
+        while len(_wc_cache) > WORDCLOUD_CACHE_SIZE:
+            _wc_cache.popitem(last=False)
+    return pngs
+
+
+# ====== PAGINASI ======
+def n_pages(n_rows, page_size=PAGE_SIZE):
+    return max(1, -(-n_rows // page_size))
+
+
+def page_slice(df, page, page_size=PAGE_SIZE):
+    page = min(max(int(page), 1), n_pages(len(df), page_size))
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size]
+
+
+# ====== DUPLIKAT (near-duplikat MinHash/LSH, lihat core.near_dup) ======
+def duplicates(df, threshold=None):
+    from core.near_dup import THRESHOLD, near_duplicates
+
+    with metrics.timer("render.duplicates", len(df)):
+        return near_duplicates(df, threshold or THRESHOLD)[1]
+
+
+def csv_bytes(df, columns=("text", "text_cleaned", "prob_aduan", "severity", "label")):
+    with metrics.timer("render.download", len(df)):
+        return df[[c for c in columns if c in df]].to_csv(index=False).encode("utf-8")
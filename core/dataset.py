@@ -0,0 +1,179 @@
+import json
+import os
+import sys
+import threading
+import time
+
+from core import pipeline
+
+SOURCE_CSV = "source/data-20rb.csv"
+CACHE_DIR = os.path.join(pipeline.BASE_DIR, ".cache", "dataset")
+# Folder static Streamlit (server.enableStaticServing, .streamlit/config.toml):
+# file di sini disajikan langsung dari disk di URL app/static/...
+STATIC_DIR = os.path.join(pipeline.BASE_DIR, "static", "dataset")
+DROP_COLUMNS = ("is_aduan", "text_clean")
+FORMAT_VERSION = 1
+BATCH_ROWS = 4096
+
+
+# ====== KONVERSI CSV -> ARROW (sekali per isi CSV) ======
+# <nama>.arrow : Arrow IPC tanpa kompresi, dibaca lewat memory map (zero-copy);
+#                halaman tabel hanya menyentuh baris yang ditampilkan
+# <nama>.csv   : salinan CSV kolom tampilan di static/, diunduh langsung dari
+#                file (tidak diserialisasi ulang per render)
+# <nama>.json  : ukuran + mtime CSV sumber, jumlah baris dan kolom
+def _paths(csv_path):
+    name = os.path.splitext(os.path.basename(csv_path))[0]
+    return (
+        os.path.join(CACHE_DIR, f"{name}.arrow"),
+        os.path.join(CACHE_DIR, f"{name}.json"),
+        os.path.join(STATIC_DIR, f"{name}.csv"),
+    )
+
+
+def _source_stat(csv_path):
+    st = os.stat(csv_path)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def is_fresh(csv_path):
+    arrow_path, meta_path, csv_out = _paths(csv_path)
+    if not all(os.path.exists(p) for p in (arrow_path, meta_path, csv_out)):
+        return False
+    with open(meta_path, "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    return meta.get("format_version") == FORMAT_VERSION and meta.get("source") == _source_stat(csv_path)
+
+
+def convert(csv_path):
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    arrow_path, meta_path, csv_out = _paths(csv_path)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    os.makedirs(STATIC_DIR, exist_ok=True)
+    source = _source_stat(csv_path)
+
+    # Tweet bisa berisi baris baru di dalam kutip
+    table = pacsv.read_csv(csv_path, parse_options=pacsv.ParseOptions(newlines_in_values=True))
+    table = table.drop_columns([c for c in DROP_COLUMNS if c in table.column_names])
+    tmp = f"{arrow_path}.{os.getpid()}.tmp"
+    with pa.OSFile(tmp, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=BATCH_ROWS)
+    os.replace(tmp, arrow_path)
+
+    tmp = f"{csv_out}.{os.getpid()}.tmp"
+    with pacsv.CSVWriter(tmp, table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=BATCH_ROWS):
+            writer.write_batch(batch)
+    os.replace(tmp, csv_out)
+
+    meta = {
+        "format_version": FORMAT_VERSION,
+        "source": source,
+        "rows": table.num_rows,
+        "columns": table.column_names,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=4)
+        f.write("\n")
+    return meta
+
+
+# ====== VIEWER: PAGINASI, FILTER & PROYEKSI KOLOM DI SERVER ======
+class ColumnarDataset:
+    def __init__(self, arrow_path, csv_path):
+        import pyarrow as pa
+
+        self.path = arrow_path
+        self.csv_path = csv_path
+        self.table = pa.ipc.open_file(pa.memory_map(arrow_path, "r")).read_all()
+        self.columns = self.table.column_names
+        self.n_rows = self.table.num_rows
+        self._lock = threading.Lock()
+        self._last = (None, None)      # (filter, indeks baris) terakhir
+
+    def values(self, column):
+        import pyarrow.compute as pc
+
+        return sorted(v for v in pc.unique(self.table[column]).to_pylist() if v is not None)
+
+    # Indeks baris yang cocok (None = semua baris). Hasil filter terakhir
+    # disimpan, jadi pindah halaman tidak menghitung ulang.
+    def _matches(self, query, filters):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        key = (query, tuple(sorted(filters.items())))
+        with self._lock:
+            if self._last[0] == key:
+                return self._last[1]
+        mask = None
+        for column, value in filters.items():
+            m = pc.equal(self.table[column], value)
+            mask = m if mask is None else pc.and_(mask, m)
+        if query:
+            text = [
+                c for c in self.columns
+                if pa.types.is_string(self.table.schema.field(c).type)
+                or pa.types.is_large_string(self.table.schema.field(c).type)
+            ]
+            hit = None
+            for column in text:
+                m = pc.match_substring(self.table[column], query, ignore_case=True)
+                hit = m if hit is None else pc.or_(hit, m)
+            if hit is not None:
+                mask = hit if mask is None else pc.and_(mask, hit)
+        indices = None if mask is None else pc.indices_nonzero(pc.fill_null(mask, False))
+        with self._lock:
+            self._last = (key, indices)
+        return indices
+
+    def count(self, query="", filters=None):
+        indices = self._matches(query, filters or {})
+        return self.n_rows if indices is None else len(indices)
+
+    # Satu halaman sebagai DataFrame (hanya kolom yang diminta)
+    def page(self, page, page_size, columns=None, query="", filters=None):
+        indices = self._matches(query, filters or {})
+        table = self.table.select(columns) if columns else self.table
+        start = (page - 1) * page_size
+        if indices is None:
+            rows = table.slice(start, page_size)
+        else:
+            rows = table.take(indices[start:start + page_size])
+        df = rows.to_pandas()
+        df.index = range(start + 1, start + 1 + len(df))
+        return df
+
+
+def load_dataset(csv_path=None):
+    # None bila CSV sumber belum ada; konversi ulang bila CSV berubah
+    csv_path = pipeline.resolve_path(csv_path or SOURCE_CSV)
+    if not os.path.exists(csv_path):
+        return None
+    if not is_fresh(csv_path):
+        convert(csv_path)
+    arrow_path, _, csv_out = _paths(csv_path)
+    return ColumnarDataset(arrow_path, csv_out)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Konversi dataset CSV ke Arrow (memory-mapped) untuk viewer")
+    parser.add_argument("--csv", default=SOURCE_CSV)
+    parser.add_argument("--force", action="store_true", help="konversi ulang walau masih baru")
+    args = parser.parse_args()
+
+    csv_path = pipeline.resolve_path(args.csv)
+    if not os.path.exists(csv_path):
+        parser.error(f"dataset {csv_path} tidak ada")
+    if not args.force and is_fresh(csv_path):
+        print("dataset sudah terkonversi", file=sys.stderr)
+    else:
+        t0 = time.perf_counter()
+        meta = convert(csv_path)
+        print(f"{meta['rows']} baris, kolom {', '.join(meta['columns'])} "
+              f"({time.perf_counter() - t0:.1f} s)", file=sys.stderr)
@@ -0,0 +1,247 @@
+import argparse
+import io
+import json
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+from core import pipeline
+from core.export import sha256_file
+
+EVAL_FILE = "evaluation.npz"
+OBJECTIVES = ("f1", "youden", "accuracy")
+
+
+# ====== SWEEP SEMUA THRESHOLD (satu pass NumPy) ======
+# Probabilitas diurutkan turun sekali; cumsum label memberi TP/FP untuk setiap
+# threshold berbeda sekaligus (prediksi aduan = prob >= threshold, sama
+# seperti core.inference). Baris pertama threshold = inf (tidak ada yang
+# diprediksi aduan), jadi kurva PR/ROC selalu mulai dari titik (0, 0).
+def sweep(y, prob):
+    y = np.asarray(y, dtype=np.int8)
+    prob = np.asarray(prob, dtype=np.float64)
+    order = np.argsort(-prob, kind="stable")
+    p, t = prob[order], y[order]
+    last = np.append(np.flatnonzero(np.diff(p)), len(p) - 1) if len(p) else np.zeros(0, dtype=np.int64)
+    tp = np.concatenate([[0], np.cumsum(t, dtype=np.int64)[last]])
+    fp = np.concatenate([[0], (last + 1) - tp[1:]])
+    pos = int(t.sum())
+    neg = len(t) - pos
+    fn, tn = pos - tp, neg - fp
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.where(tp + fp > 0, tp / (tp + fp), 1.0)
+        recall = tp / pos if pos else np.zeros(len(tp))
+        f1 = np.where(precision + recall > 0, 2 * precision * recall / (precision + recall), 0.0)
+        fpr = fp / neg if neg else np.zeros(len(fp))
+    return {
+        "threshold": np.concatenate([[np.inf], p[last]]),
+        "tp": tp, "fp": fp, "fn": fn, "tn": tn,
+        "precision": precision,
+        "recall": recall,
+        "f1": f1,
+        "fpr": fpr,
+        "accuracy": (tp + tn) / len(t) if len(t) else np.zeros(len(tp)),
+    }
+
+
+def roc_auc(curves):
+    # Trapesium di sepanjang kurva ROC (np.trapz sudah deprecated di NumPy 2)
+    fpr, tpr = curves["fpr"], curves["recall"]
+    return float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2))
+
+
+def _row(curves, threshold):
+    # Baris terakhir dengan threshold kurva >= threshold (kurva turun)
+    return int(np.searchsorted(-curves["threshold"], -threshold, side="right")) - 1
+
+
+def metrics_at(curves, threshold):
+    i = _row(curves, threshold)
+    return {
+        "threshold": float(threshold),
+        "accuracy": round(float(curves["accuracy"][i]), 4),
+        "precision": round(float(curves["precision"][i]), 4),
+        "recall": round(float(curves["recall"][i]), 4),
+        "f1": round(float(curves["f1"][i]), 4),
+        "confusion": {k: int(curves[k][i]) for k in ("tp", "fp", "fn", "tn")},
+    }
+
+
+def binary_metrics(y, prob, threshold):
+    return metrics_at(sweep(y, prob), threshold)
+
+
+# Operating point: threshold dengan F1 / Youden J (TPR - FPR) / akurasi
+# terbesar. Threshold yang dipakai = nilai tengah antara probabilitas kurva
+# itu dan berikutnya, supaya tidak menempel di satu skor tertentu.
+def choose_threshold(curves, objective="f1"):
+    if objective not in OBJECTIVES:
+        raise ValueError(f"objective {objective!r} tidak dikenal ({' | '.join(OBJECTIVES)})")
+    score = curves["recall"] - curves["fpr"] if objective == "youden" else curves[objective]
+    i = int(np.argmax(score[1:])) + 1
+    t = curves["threshold"]
+    below = t[i + 1] if i + 1 < len(t) else 0.0
+    return round(float((t[i] + below) / 2), 4)
+
+
+# ====== HASIL EVALUASI TERSIMPAN (di folder ekspor native) ======
+# evaluation.npz menyimpan label + probabilitas per baris; ringkasan dan
+# operating point dicatat di manifest.json ekspor native ("evaluation").
+# Skor ulang hanya bila dataset atau versi pipeline berubah.
+class Evaluation:
+    def __init__(self, y, prob, info):
+        self.y = y
+        self.prob = prob
+        self.info = info
+        self.curves = sweep(y, prob)
+        self.auc = roc_auc(self.curves)
+        self._png = None
+
+    @property
+    def operating_point(self):
+        return self.info["operating_point"]["threshold"]
+
+    def at(self, threshold):
+        return metrics_at(self.curves, threshold)
+
+    # Kurva precision-recall + ROC, titik = operating point
+    def curves_png(self):
+        if self._png is not None:
+            return self._png
+        from matplotlib.figure import Figure
+
+        c = self.curves
+        i = _row(c, self.operating_point)
+        fig = Figure(figsize=(10, 4))
+        ax1, ax2 = fig.subplots(1, 2)
+        ax1.plot(c["recall"][1:], c["precision"][1:], color="#316398")
+        ax1.scatter([c["recall"][i]], [c["precision"][i]], color="#e74c3c", zorder=3)
+        ax1.set(xlabel="Recall", ylabel="Precision", title="Precision-Recall", xlim=(0, 1), ylim=(0, 1.02))
+        ax2.plot(c["fpr"], c["recall"], color="#316398")
+        ax2.plot([0, 1], [0, 1], color="#bdc3c7", linestyle="--")
+        ax2.scatter([c["fpr"][i]], [c["recall"][i]], color="#e74c3c", zorder=3)
+        ax2.set(xlabel="False positive rate", ylabel="True positive rate",
+                title=f"ROC (AUC {self.auc:.3f})", xlim=(0, 1), ylim=(0, 1.02))
+        fig.tight_layout()
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi=100)
+        self._png = buf.getvalue()
+        return self._png
+
+
+def load_evaluation(native_dir):
+    from core.export import load_manifest
+
+    info = load_manifest(native_dir).get("evaluation")
+    path = os.path.join(native_dir, EVAL_FILE)
+    if not info or not os.path.exists(path):
+        return None
+    with np.load(path, allow_pickle=False) as data:
+        return Evaluation(data["y"], data["prob"], info)
+
+
+def save_evaluation(native_dir, y, prob, dataset, version, objective="f1"):
+    from core.export import MANIFEST, load_manifest
+
+    curves = sweep(y, prob)
+    threshold = choose_threshold(curves, objective)
+    np.savez_compressed(
+        os.path.join(native_dir, EVAL_FILE),
+        y=np.asarray(y, dtype=np.int8), prob=np.asarray(prob, dtype=np.float32),
+    )
+    manifest = load_manifest(native_dir)
+    manifest["evaluation"] = {
+        "file": EVAL_FILE,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "pipeline_version": version,
+        "dataset": dataset,
+        "auc": round(roc_auc(curves), 4),
+        "operating_point": dict(metrics_at(curves, threshold), objective=objective),
+    }
+    with open(os.path.join(native_dir, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=4)
+        f.write("\n")
+    return manifest["evaluation"]
+
+
+# Ganti "version" dan "threshold" level atas saja, format file lainnya tetap
+def apply_threshold(spec_path, threshold, version):
+    with open(spec_path, "r", encoding="utf-8") as f:
+        text = f.read()
+    for key, value in (("version", version), ("threshold", threshold)):
+        text, n = re.subn(rf'^(    "{key}": )[^,\n]+', lambda m: m.group(1) + json.dumps(value), text,
+                          count=1, flags=re.M)
+        if not n:
+            raise ValueError(f"{spec_path}: field {key!r} tidak ditemukan")
+    with open(spec_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    pipeline.load_spec(spec_path)
+
+
+def score_dataset(csv_path, text_column="text", label_column="label", use_cache=False):
+    from core.inference import predict_batch
+    from core.train import load_dataset
+
+    texts, y = load_dataset(csv_path, text_column, label_column)
+    _, prob, _ = predict_batch(texts, use_cache=use_cache)
+    return y, prob
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Evaluasi model pada CSV berlabel: sweep semua threshold, simpan operating point"
+    )
+    parser.add_argument("--csv", default="source/data-20rb.csv")
+    parser.add_argument("--text-column", default="text")
+    parser.add_argument("--label-column", default="label")
+    parser.add_argument("--objective", choices=OBJECTIVES, default="f1")
+    parser.add_argument("--force", action="store_true", help="skor ulang walau hasil tersimpan masih cocok")
+    parser.add_argument("--cache", action="store_true",
+                        help="pakai cache hasil prediksi (ke disk hanya bila ADUAN_RESULT_CACHE diisi)")
+    parser.add_argument("--apply", action="store_true",
+                        help="tulis operating point ke \"threshold\" di pipeline.json (butuh --version baru)")
+    parser.add_argument("--version", help="versi pipeline.json baru untuk --apply")
+    args = parser.parse_args(argv)
+
+    spec = pipeline.load_spec()
+    if args.apply and (not args.version or args.version == spec["version"]):
+        parser.error("--apply butuh --version baru (cache hasil prediksi dikunci per versi)")
+    if not spec.get("native"):
+        parser.error("pipeline.json tidak punya \"native\"; jalankan python -m core.export dulu")
+    native_dir = pipeline.resolve_path(spec["native"])
+    csv_path = pipeline.resolve_path(args.csv)
+    if not os.path.exists(csv_path):
+        parser.error(f"dataset {csv_path} tidak ada")
+
+    sha = sha256_file(csv_path)
+    saved = None if args.force else load_evaluation(native_dir)
+    if (saved is not None and saved.info["dataset"]["sha256"] == sha
+            and saved.info["pipeline_version"] == spec["version"]):
+        y, prob = saved.y, saved.prob
+        print("[evaluate] memakai probabilitas tersimpan", file=sys.stderr)
+    else:
+        t0 = time.perf_counter()
+        y, prob = score_dataset(csv_path, args.text_column, args.label_column, args.cache)
+        print(f"[evaluate] {len(y)} baris diskor dalam {time.perf_counter() - t0:.1f} s", file=sys.stderr)
+
+    dataset = {"path": args.csv, "sha256": sha, "rows": int(len(y)), "aduan": int(np.sum(y))}
+    info = save_evaluation(native_dir, y, prob, dataset, spec["version"], args.objective)
+    report = {
+        "auc": info["auc"],
+        "spec_threshold": metrics_at(sweep(y, prob), spec["threshold"]),
+        "operating_point": info["operating_point"],
+    }
+    print(json.dumps(report, indent=2))
+
+    if args.apply:
+        threshold = info["operating_point"]["threshold"]
+        apply_threshold(pipeline.SPEC_PATH, threshold, args.version)
+        print(f"[evaluate] threshold {threshold} ditulis ke pipeline.json (versi {args.version})",
+              file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+import numpy as np
+
+from core import pipeline
+
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 1
+BOOSTER_FILE = "booster.ubj"
+VOCAB_FILE = "vocab.txt"
+TREES_FILE = "trees.npz"
+SEVERITY_FILE = "severity.tsv"
+# Parameter CountVectorizer yang memengaruhi transform
+_VECTORIZER_PARAMS = (
+    "lowercase", "token_pattern", "ngram_range", "binary",
+    "analyzer", "strip_accents", "stop_words", "preprocessor", "tokenizer",
+)
+
+
+# ====== EKSPOR PICKLE -> FORMAT NATIVE ======
+# booster.ubj : model XGBoost format native (UBJSON), tanpa wrapper sklearn
+# vocab.txt   : satu istilah per baris (UTF-8), nomor baris = indeks kolom
+#               (= urutan abjad); istilah hanya berisi \w dan spasi
+# trees.npz   : pohon booster sebagai array datar untuk core.tree_engine
+# severity.tsv: leksikon severity yang sudah di-preprocess (core.severity)
+# manifest    : parameter tokenisasi, jumlah fitur dan sha256 pickle sumber
+def sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def export_native(spec, out_dir):
+    import joblib
+
+    vec_path = pipeline.resolve_path(spec["vectorizer"])
+    model_path = pipeline.resolve_path(spec["model"])
+    sources = {
+        os.path.basename(vec_path): sha256_file(vec_path),
+        os.path.basename(model_path): sha256_file(model_path),
+    }
+    return write_native(joblib.load(vec_path), joblib.load(model_path).get_booster(), out_dir, sources)
+
+
+# CountVectorizer + Booster (objek, bukan path) -> folder native. Dipakai juga
+# oleh core.train setelah fit, tanpa memuat ulang pickle.
+def write_native(vectorizer, booster, out_dir, sources):
+    from core.tree_engine import save_trees, trees_from_booster_json
+
+    terms = sorted(vectorizer.vocabulary_, key=vectorizer.vocabulary_.get)
+    if [vectorizer.vocabulary_[t] for t in terms] != list(range(len(terms))):
+        raise ValueError("indeks vocabulary tidak berurutan 0..n-1")
+    if terms != sorted(terms):
+        raise ValueError("indeks vocabulary tidak mengikuti urutan abjad")
+    params = {k: vectorizer.get_params()[k] for k in _VECTORIZER_PARAMS}
+    unsupported = ("strip_accents", "stop_words", "preprocessor", "tokenizer")
+    if params["analyzer"] != "word" or any(params[k] is not None for k in unsupported):
+        raise ValueError(f"vectorizer tidak didukung: {params}")
+
+    n_features = booster.num_features()
+    if n_features != len(terms) + 1:
+        raise ValueError(f"model memakai {n_features} fitur, vocabulary {len(terms)} + 1 keyword")
+    trees = trees_from_booster_json(booster.save_raw("json"))
+
+    os.makedirs(out_dir, exist_ok=True)
+    booster.save_model(os.path.join(out_dir, BOOSTER_FILE))
+    save_trees(trees, os.path.join(out_dir, TREES_FILE))
+    with open(os.path.join(out_dir, VOCAB_FILE), "w", encoding="utf-8", newline="\n") as f:
+        f.write("\n".join(terms))
+        f.write("\n")
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "booster": BOOSTER_FILE,
+        "vocabulary": VOCAB_FILE,
+        "trees": TREES_FILE,
+        "n_terms": len(terms),
+        "n_features": n_features,
+        "vectorizer": {
+            "lowercase": params["lowercase"],
+            "token_pattern": params["token_pattern"],
+            "ngram_range": list(params["ngram_range"]),
+            "binary": params["binary"],
+            "dtype": np.dtype(vectorizer.dtype).name,
+        },
+        "source": sources,
+    }
+    # Hasil core.evaluate tetap berlaku bila model sumbernya sama; leksikon
+    # severity tidak bergantung pada model (kuncinya dicek saat dimuat)
+    try:
+        old = load_manifest(out_dir)
+    except (OSError, ValueError):
+        old = {}
+    if old.get("source") == sources and "evaluation" in old:
+        manifest["evaluation"] = old["evaluation"]
+    if "severity" in old:
+        manifest["severity"] = old["severity"]
+    with open(os.path.join(out_dir, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=4)
+        f.write("\n")
+    return manifest
+
+
+def write_severity(spec, out_dir):
+    from core import registry
+    from core.severity import compile_lexicon, lexicon_key, load_lexicon, save_terms
+
+    stemmer = registry.get_stemmer() if spec["stem"] else None
+    terms = compile_lexicon(
+        load_lexicon(pipeline.resolve_path(spec["severity"]["lexicon"])), registry.get_normalizer(), stemmer
+    )
+    save_terms(terms, os.path.join(out_dir, SEVERITY_FILE))
+    manifest = load_manifest(out_dir)
+    manifest["severity"] = {"file": SEVERITY_FILE, "key": lexicon_key(spec), "terms": len(terms)}
+    with open(os.path.join(out_dir, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=4)
+        f.write("\n")
+    return manifest["severity"]
+
+
+# ====== LOADER TANPA UNPICKLE ======
+def load_manifest(native_dir):
+    with open(os.path.join(native_dir, MANIFEST), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format_version") != FORMAT_VERSION:
+        raise ValueError(
+            f"{native_dir}: format_version {manifest.get('format_version')!r} "
+            f"tidak didukung (harus {FORMAT_VERSION})"
+        )
+    return manifest
+
+
+def load_vocabulary(native_dir, manifest=None):
+    manifest = manifest or load_manifest(native_dir)
+    with open(os.path.join(native_dir, manifest["vocabulary"]), "r", encoding="utf-8", newline="\n") as f:
+        vocab = f.read().split("\n")[:-1]
+    if len(vocab) != manifest["n_terms"]:
+        raise ValueError(f"{native_dir}: vocabulary berisi {len(vocab)} istilah, manifest {manifest['n_terms']}")
+    return vocab
+
+
+def load_native_vectorizer(native_dir):
+    from core.vectorizer import VocabVectorizer
+
+    manifest = load_manifest(native_dir)
+    params = manifest["vectorizer"]
+    return VocabVectorizer(
+        load_vocabulary(native_dir, manifest),
+        ngram_range=params["ngram_range"],
+        token_pattern=params["token_pattern"],
+        lowercase=params["lowercase"],
+        binary=params["binary"],
+        dtype=params["dtype"],
+    )
+
+
+class NativeModel:
+    # Pengganti XGBClassifier biner: cukup Booster + predict_proba
+    def __init__(self, booster, n_features):
+        self.booster = booster
+        self.n_features_in_ = n_features
+
+    def predict_proba(self, X):
+        if X.shape[1] != self.n_features_in_:
+            raise ValueError(f"X punya {X.shape[1]} fitur, model butuh {self.n_features_in_}")
+        p = self.booster.inplace_predict(X)
+        return np.column_stack([1 - p, p])
+
+
+def load_native_model(native_dir):
+    import xgboost as xgb
+
+    manifest = load_manifest(native_dir)
+    booster = xgb.Booster()
+    booster.load_model(os.path.join(native_dir, manifest["booster"]))
+    if booster.num_features() != manifest["n_features"]:
+        raise ValueError(f"{native_dir}: booster punya {booster.num_features()} fitur, manifest {manifest['n_features']}")
+    return NativeModel(booster, manifest["n_features"])
+
+
+def load_severity_terms(native_dir, key):
+    # None bila belum diekspor atau leksikon / preprocessing sudah berubah
+    from core.severity import load_terms
+
+    info = load_manifest(native_dir).get("severity")
+    if not info or info.get("key") != key:
+        return None
+    return load_terms(os.path.join(native_dir, info["file"]))
+
+
+def native_files(native_dir):
+    manifest = load_manifest(native_dir)
+    files = [os.path.join(native_dir, manifest[k]) for k in ("booster", "vocabulary", "trees") if k in manifest]
+    if "severity" in manifest:
+        files.append(os.path.join(native_dir, manifest["severity"]["file"]))
+    return files
+
+
+# ====== CEK PARITAS NATIVE vs PICKLE ======
+# Sama persis: bentuk, dtype data/indices/indptr, urutan indeks dan nilai
+def same_matrix(a, b):
+    return (
+        a.shape == b.shape
+        and all(x.dtype == y.dtype and np.array_equal(x, y)
+                for x, y in ((a.data, b.data), (a.indices, b.indices), (a.indptr, b.indptr)))
+    )
+
+
+def verify(spec, native_dir, texts):
+    import joblib
+    from scipy.sparse import hstack
+
+    from core import registry
+    from core.keywords import KeywordIndex, keyword_column
+    from core.preprocess import preprocess_tokens
+    from core.tree_engine import load_tree_model
+
+    manifest = load_manifest(native_dir)
+    sources = {os.path.basename(spec[k]): pipeline.resolve_path(spec[k]) for k in ("vectorizer", "model")}
+    stale = [
+        name for name, path in sources.items()
+        if manifest["source"].get(name) != sha256_file(path)
+    ]
+
+    normalizer = registry.get_normalizer()
+    stemmer = registry.get_stemmer() if spec["stem"] else None
+    tokens = [preprocess_tokens(t, normalizer, stemmer) for t in texts]
+    cleaned = [" ".join(t) for t in tokens]
+    kw = keyword_column(tokens, registry.get_aduan_keywords())
+
+    old_X = hstack(
+        [joblib.load(pipeline.resolve_path(spec["vectorizer"])).transform(cleaned), kw],
+        format="csr"
+    )
+    new_X, _ = KeywordIndex(
+        registry.get_aduan_keywords(), load_native_vectorizer(native_dir)
+    ).transform(tokens)
+    same_X = same_matrix(old_X, new_X)
+    old_p = joblib.load(pipeline.resolve_path(spec["model"])).predict_proba(old_X)[:, 1]
+    new_p = load_native_model(native_dir).predict_proba(new_X)[:, 1]
+    tree_p = load_tree_model(native_dir).predict_proba(new_X)[:, 1] if "trees" in manifest else None
+    return {
+        "rows": len(texts),
+        "stale_sources": stale,
+        "same_matrix": bool(same_X),
+        "max_abs_diff": float(np.max(np.abs(old_p - new_p))) if len(texts) else 0.0,
+        # Evaluator NumPy harus sama persis (bit per bit) dengan XGBoost
+        "tree_engine_exact": None if tree_p is None else bool(np.array_equal(tree_p, new_p)),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Ekspor vectorizer + XGBoost ke format native (tanpa pickle) dan cek paritasnya"
+    )
+    parser.add_argument("--out", help="folder tujuan (default: 'native' di pipeline.json)")
+    parser.add_argument("--verify", metavar="CSV", nargs="?", const="",
+                        help="bandingkan prediksi native vs pickle (tanpa CSV: teks contoh)")
+    parser.add_argument("--column", default="text")
+    args = parser.parse_args(argv)
+
+    spec = pipeline.load_spec()
+    out_dir = pipeline.resolve_path(args.out or spec.get("native") or "model/native")
+
+    if args.verify is None:
+        manifest = export_native(spec, out_dir)
+        if spec.get("severity"):
+            manifest["severity"] = write_severity(spec, out_dir)
+        sizes = ", ".join(
+            f"{os.path.basename(p)} ({os.path.getsize(p) / 1024:.0f} KB)" for p in native_files(out_dir)
+        )
+        print(f"ekspor ke {out_dir}: {manifest['n_terms']} istilah, {manifest['n_features']} fitur | {sizes}")
+        return
+
+    if args.verify:
+        import pandas as pd
+        texts = pd.read_csv(args.verify)[args.column].fillna("").astype(str).tolist()
+    else:
+        from core.loadgen import SAMPLE_TEXTS
+        texts = list(SAMPLE_TEXTS)
+    result = verify(spec, out_dir, texts)
+    print(json.dumps(result, indent=2))
+    ok = (
+        result["same_matrix"] and result["max_abs_diff"] == 0.0 and not result["stale_sources"]
+        and result["tree_engine_exact"] is not False
+    )
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+import numpy as np
+
+from core import metrics, registry
+from core.parallel import preprocess_parallel
+from core.regex_booster import apply_boost
+from core.result_cache import cache_key
+
+DEFAULT_CHUNK_SIZE = 4096
+LABEL_NAMES = ("bukan aduan", "aduan")
+
+
+# Matriks fitur (vocabulary + flag keyword) dari token preprocessing; flag
+# keyword dihitung lewat KeywordIndex di atas count matrix yang sama
+def _score(tokens):
+    cleaned = [" ".join(t) for t in tokens]
+    X, _ = registry.get_keyword_index().transform(tokens)
+    with metrics.timer("predict", len(tokens)):
+        prob = registry.get_xgb_model().predict_proba(X)[:, 1]
+    return cleaned, prob
+
+
+# Keyword aduan yang cocok per text_cleaned (hasil predict_text / predict_batch)
+def keyword_matches(cleaned_texts):
+    return registry.get_keyword_index().matched([c.split() for c in cleaned_texts])
+
+
+# Skor severity leksikon per text_cleaned (None bila tidak diaktifkan di spec)
+def severity_scores(cleaned_texts):
+    scorer = registry.get_severity_scorer()
+    return scorer.score(cleaned_texts) if scorer is not None else None
+
+
+# ====== REGEX BOOSTER (source/booster.json) ======
+# Fitur aturan kena per teks, dihitung dari teks asli (lowercase) karena ekor
+# aturan memakai bentuk kata sebelum stem/stopword ("tidak berfungsi").
+def rule_hits(texts):
+    return registry.get_regex_booster().hit_matrix(texts)
+
+
+# Aturan booster yang kena pada satu teks, sebagai "kepala -> ekor"
+def rule_matches(text):
+    booster = registry.get_regex_booster()
+    return [booster.describe(i) for i in booster.hits(text)]
+
+
+# key (teks lowercase), text_cleaned, prob model -> (prob, label, text_cleaned).
+# Boost hanya dihitung bila weight di spec > 0.
+def _finish(keys, cleaned, prob):
+    spec = registry.get_spec()
+    weight = (spec.get("booster") or {}).get("weight", 0)
+    if weight:
+        with metrics.timer("booster", len(keys)):
+            prob = apply_boost(prob, rule_hits(keys).getnnz(axis=1), weight)
+    threshold = spec["threshold"]
+    return [(p, int(p >= threshold), c) for p, c in zip(np.asarray(prob).tolist(), cleaned)]
+
+
+# ====== PREDIKSI SATU TEKS ======
+def predict_text(text, use_cache=True):
+    with metrics.timer("predict_text", 1):
+        cache = registry.get_result_cache() if use_cache else None
+        key = cache_key(text)
+        result = cache.get(key) if cache is not None else None
+        if result is None:
+            cleaned, prob = _score(preprocess_parallel([text], workers=1))
+            result = _finish([key], cleaned, prob)[0]
+            if cache is not None:
+                cache.put(key, result)
+    prob, label, cleaned = result
+    return label, prob, cleaned
+
+
+# ====== NEAR-DUPLIKAT (spec "near_duplicates") ======
+# Bila score_representative aktif, hanya satu text_cleaned per cluster
+# near-duplikat yang diskor; anggota lain memakai probabilitas representatifnya.
+# Default mati karena hasilnya tidak lagi persis sama per teks.
+def _representatives(cleaned_unique):
+    cfg = registry.get_spec().get("near_duplicates") or {}
+    if not cfg.get("score_representative") or len(cleaned_unique) < 2:
+        return None
+    from core.near_dup import THRESHOLD, cluster
+
+    with metrics.timer("near_dup", len(cleaned_unique)):
+        root = cluster(cleaned_unique, cfg.get("threshold", THRESHOLD))
+    metrics.inc("near_dup_skipped", int(len(root) - len(set(root.tolist()))))
+    return {c: cleaned_unique[r] for c, r in zip(cleaned_unique, root.tolist())}
+
+
+# ====== PREDIKSI BATCH ======
+# Teks yang sama (abaikan kapital) diproses sekali dan hasil lama diambil dari
+# result cache. Sisanya di-preprocess (dibagi ke beberapa proses bila batch
+# besar), lalu tiap text_cleaned unik di-vectorize + predict_proba sekali per chunk.
+def predict_batch(texts, chunk_size=DEFAULT_CHUNK_SIZE, workers=None, use_cache=True):
+    if chunk_size < 1:
+        raise ValueError("chunk_size harus >= 1")
+    texts = list(texts)
+    with metrics.timer("predict_batch", len(texts)):
+        return _predict_batch(texts, chunk_size, workers, use_cache)
+
+
+def _predict_batch(texts, chunk_size, workers, use_cache):
+    keys = [cache_key(t) for t in texts]
+    first = {}
+    for i, key in enumerate(keys):
+        first.setdefault(key, i)
+    cache = registry.get_result_cache() if use_cache else None
+    results = dict(zip(first, cache.get_many(first) if cache is not None else [None] * len(first)))
+
+    missing = [key for key, r in results.items() if r is None]
+    scored = {}
+    todo = []
+    if missing:
+        tokens = preprocess_parallel([texts[first[key]] for key in missing], workers=workers)
+        cleaned = [" ".join(t) for t in tokens]
+        unique = dict(zip(cleaned, tokens))
+        rep = _representatives(list(unique))
+        todo = [unique[c] for c in dict.fromkeys(rep.values())] if rep else list(unique.values())
+        for start in range(0, len(todo), chunk_size):
+            part, prob = _score(todo[start:start + chunk_size])
+            scored.update(zip(part, prob))
+        if rep:
+            scored.update((c, scored[r]) for c, r in rep.items())
+        prob = np.fromiter((scored[c] for c in cleaned), dtype=np.float32, count=len(cleaned))
+        new = list(zip(missing, _finish(missing, cleaned, prob)))
+        results.update(new)
+        if cache is not None:
+            cache.put_many(new)
+    if cache is not None:
+        # Hanya text_cleaned yang benar-benar masuk model (bukan salinan wakil near-duplicate)
+        cache.record_batch(len(texts), len(todo))
+
+    rows = [results[key] for key in keys]
+    prob = np.fromiter((r[0] for r in rows), dtype=np.float32, count=len(rows))
+    label = np.fromiter((r[1] for r in rows), dtype=np.int8, count=len(rows))
+    return [r[2] for r in rows], prob, label
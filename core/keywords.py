@@ -0,0 +1,153 @@
+import re
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from core import metrics
+from core.preprocess import feature_tokens
+
+# Keyword hanya bisa sama dengan token preprocessing bila berupa satu kata \w+
+# (token tidak pernah berisi spasi atau tanda baca)
+_WORD_RE = re.compile(r"\w+")
+
+
+# ====== FILE KEYWORD (teks biasa, satu keyword per baris) ======
+def load_keywords(path):
+    if path.endswith(".npy"):
+        try:
+            return [str(k) for k in np.load(path, allow_pickle=False)]
+        except ValueError as e:
+            raise ValueError(
+                f"{path} berisi objek Python (butuh pickle); ubah dulu dengan "
+                f"`python -m core.keywords {path} <file.txt>`"
+            ) from e
+    with open(path, "r", encoding="utf-8", newline="\n") as f:
+        return [line for line in f.read().split("\n") if line]
+
+
+def save_keywords(keywords, path):
+    keywords = [str(k) for k in keywords]
+    bad = [k for k in keywords if not k or "\n" in k]
+    if bad:
+        raise ValueError(f"keyword kosong / berisi baris baru: {bad[:5]}")
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write("\n".join(keywords))
+        f.write("\n")
+
+
+# Cara lama (acuan paritas): irisan set token per teks
+def keyword_flags(tokens, aduan_keywords):
+    return np.fromiter(
+        (not aduan_keywords.isdisjoint(feature_tokens(t)) for t in tokens),
+        dtype=np.int64, count=len(tokens)
+    )
+
+
+def keyword_column(tokens, aduan_keywords):
+    return csr_matrix(keyword_flags(tokens, aduan_keywords).reshape(-1, 1))
+
+
+# ====== INDEKS KEYWORD SEJAJAR VOCABULARY ======
+# Keyword satu kata yang ada di vocabulary memakai kolomnya sendiri; keyword
+# lowercase di luar vocabulary ditambahkan sebagai kolom bayangan setelah
+# kolom model. Jumlah keyword per teks = X_biner @ mask, satu perkalian
+# sparse untuk seluruh batch. Kolom bayangan lalu dibuang dan diganti satu
+# kolom flag keyword (fitur terakhir model).
+#
+# Vectorizer me-lowercase teks dan mengabaikan kata 1 huruf, sedangkan cara
+# lama membandingkan token apa adanya. Baris yang tokennya tidak lowercase
+# (slang huruf besar tanpa stem) dihitung ulang dengan irisan set, begitu juga
+# semua baris bila ada keyword 1 huruf, supaya hasilnya tetap sama.
+class KeywordIndex:
+    def __init__(self, keywords, vectorizer):
+        self.keywords = frozenset(keywords)
+        vocab = vectorizer.vocabulary_
+        self.n_vocab = len(vocab)
+        words = sorted(k for k in self.keywords if _WORD_RE.fullmatch(k))
+        shadow = [k for k in words if k == k.lower() and k not in vocab]
+        self.vectorizer = vectorizer.extended(shadow)
+
+        ext = self.vectorizer.vocabulary_
+        cols = {ext[k]: k for k in words if k in ext}
+        self.mask = np.zeros(len(ext), dtype=np.int64)
+        self.mask[list(cols)] = 1
+        self._col_keyword = cols
+        self.n_in_vocab = sum(c < self.n_vocab for c in cols)
+        self.n_shadow = len(shadow)
+        self._short = any(len(k) < 2 for k in words)
+
+    def _fallback_rows(self, tokens):
+        if self._short:
+            return list(range(len(tokens)))
+        return [
+            i for i, t in enumerate(tokens)
+            if any(w != w.lower() for w in t)
+        ]
+
+    # Token batch -> (matriks fitur model = vocabulary + kolom flag, jumlah keyword per baris)
+    def transform(self, tokens):
+        with metrics.timer("vectorize", len(tokens)):
+            X = self.vectorizer.transform_tokens(tokens)
+        with metrics.timer("keyword", len(tokens)):
+            ones = csr_matrix((np.ones_like(X.data), X.indices, X.indptr), shape=X.shape)
+            counts = ones @ self.mask
+            for i in self._fallback_rows(tokens):
+                counts[i] = len(self.keywords.intersection(feature_tokens(tokens[i])))
+            X = self._model_matrix(X, counts > 0)
+        return X, counts
+
+    # Buang kolom bayangan, tambahkan flag di kolom n_vocab (setara
+    # hstack([X_vocab, flag], format="csr") tanpa membangun matriks kedua)
+    def _model_matrix(self, X, flags):
+        keep = X.indices < self.n_vocab
+        kept = np.concatenate([[0], np.cumsum(keep)])[X.indptr]
+        pos = kept[1:][flags]
+        indptr = kept + np.concatenate([[0], np.cumsum(flags)])
+        return csr_matrix(
+            (np.insert(X.data[keep], pos, 1),
+             np.insert(X.indices[keep], pos, self.n_vocab),
+             indptr.astype(X.indptr.dtype)),
+            shape=(X.shape[0], self.n_vocab + 1),
+        )
+
+    # Keyword yang cocok per teks (untuk ditampilkan / dilaporkan)
+    def matched(self, tokens):
+        X = self.vectorizer.transform_tokens(tokens)
+        fallback = set(self._fallback_rows(tokens))
+        out = []
+        for i in range(X.shape[0]):
+            if i in fallback:
+                found = self.keywords.intersection(feature_tokens(tokens[i]))
+            else:
+                row = X.indices[X.indptr[i]:X.indptr[i + 1]]
+                found = (self._col_keyword[j] for j in row if j in self._col_keyword)
+            out.append(sorted(found))
+        return out
+
+    def stats(self):
+        return {
+            "keywords": len(self.keywords),
+            "columns": len(self._col_keyword),
+            "in_vocabulary": self.n_in_vocab,
+            "shadow_columns": self.n_shadow,
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Ubah file keyword .npy (pickle/object array) ke teks satu keyword per baris "
+                    "atau ke .npy array string tanpa pickle"
+    )
+    parser.add_argument("src", help="file .npy sumber")
+    parser.add_argument("dst", help="file .txt / .npy tujuan (boleh sama dengan src)")
+    args = parser.parse_args()
+
+    # Satu-satunya tempat allow_pickle=True: konversi sekali dari file lama
+    keywords = [str(k) for k in np.load(args.src, allow_pickle=True)]
+    if args.dst.endswith(".npy"):
+        np.save(args.dst, np.array(keywords, dtype=str), allow_pickle=False)
+    else:
+        save_keywords(keywords, args.dst)
+    print(f"{len(keywords)} keyword -> {args.dst}")
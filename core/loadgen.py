@@ -0,0 +1,114 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+
+import numpy as np
+
+SAMPLE_TEXTS = [
+    "jalan rusak parah di depan pasar gak diperbaiki",
+    "lampu merah mati di perempatan, macet total",
+    "terima kasih infonya min",
+    "bus trans semanggi telat terus tiap pagi",
+    "ada kecelakaan motor di jalan ahmad yani",
+    "selamat pagi warga surabaya",
+    "trotoar dipakai parkir motor, pejalan kaki susah lewat",
+    "info lalu lintas sore ini lancar",
+]
+
+
+# ====== LOAD GENERATOR UNTUK core.service ======
+async def _client(host, port, path, payloads, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for payload in payloads:
+            body = json.dumps(payload).encode("utf-8")
+            t0 = time.perf_counter()
+            writer.write(
+                f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+            )
+            await writer.drain()
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.decode("latin-1").split("\r\n"):
+                if line.lower().startswith("content-length:"):
+                    length = int(line.split(":", 1)[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - t0)
+            if not head.startswith(b"HTTP/1.1 200"):
+                errors.append(head.split(b"\r\n", 1)[0].decode("latin-1"))
+    finally:
+        writer.close()
+
+
+# vary=True (default): tiap teks yang dikirim dibuat unik lewat bench.scale_texts
+# (urutan kata diacak, kadang satu kata dibuang), jadi latensi mengukur model,
+# bukan result cache server. vary=False mengirim teks apa adanya (berulang).
+async def run_load(host, port, texts, requests, concurrency, batch_size=0, vary=True):
+    path = "/predict_batch" if batch_size else "/predict"
+    k = batch_size or 1
+    if vary:
+        from core.bench import scale_texts
+        sent = scale_texts(texts, requests * k, seed=random.randrange(1 << 30))
+    else:
+        sent = random.choices(texts, k=requests * k)
+    payloads = [
+        {"texts": sent[i * k:(i + 1) * k]} if batch_size else {"text": sent[i]}
+        for i in range(requests)
+    ]
+    latencies, errors = [], []
+    shards = [payloads[i::concurrency] for i in range(concurrency)]
+    t0 = time.perf_counter()
+    await asyncio.gather(*(
+        _client(host, port, path, shard, latencies, errors) for shard in shards if shard
+    ))
+    elapsed = time.perf_counter() - t0
+    ms = np.array(latencies) * 1000
+    texts_scored = requests * (batch_size or 1)
+    return {
+        "endpoint": path,
+        "requests": requests,
+        "concurrency": concurrency,
+        "batch_size": batch_size or 1,
+        "unique_texts": len(set(sent)),
+        "errors": len(errors),
+        "elapsed_s": round(elapsed, 3),
+        "requests_per_s": round(requests / elapsed, 1),
+        "texts_per_s": round(texts_scored / elapsed, 1),
+        "latency_ms": {
+            "p50": round(float(np.percentile(ms, 50)), 2),
+            "p90": round(float(np.percentile(ms, 90)), 2),
+            "p99": round(float(np.percentile(ms, 99)), 2),
+            "max": round(float(ms.max()), 2),
+        },
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load generator untuk core.service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("-n", "--requests", type=int, default=2000)
+    parser.add_argument("-c", "--concurrency", type=int, default=32)
+    parser.add_argument("--batch-size", type=int, default=0,
+                        help="0 = /predict satu teks, >0 = /predict_batch dengan N teks")
+    parser.add_argument("--csv", help="ambil teks dari kolom `text` file CSV ini")
+    parser.add_argument("--repeat", action="store_true",
+                        help="kirim teks apa adanya (berulang), mengukur jalur result cache")
+    args = parser.parse_args(argv)
+
+    texts = SAMPLE_TEXTS
+    if args.csv:
+        import pandas as pd
+        texts = pd.read_csv(args.csv)["text"].dropna().astype(str).tolist()
+    report = asyncio.run(run_load(
+        args.host, args.port, texts, args.requests, args.concurrency, args.batch_size,
+        not args.repeat,
+    ))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+import bisect
+import contextvars
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# ====== KONFIGURASI ======
+# ADUAN_METRICS=0 mematikan semua timer: tiap tahap tinggal satu cek boolean.
+# ADUAN_METRICS_FILE=path menulis metrik format teks Prometheus ke file itu
+# setiap trace selesai (untuk textfile collector / scraper lokal).
+ENABLED = os.environ.get("ADUAN_METRICS", "1") != "0"
+TEXTFILE = os.environ.get("ADUAN_METRICS_FILE") or None
+BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+_lock = threading.Lock()
+_hist = {}       # tahap -> [hitungan per bucket (+Inf di akhir), total detik, jumlah]
+_rows = {}       # tahap -> total baris yang diproses
+_counters = {}
+_trace = contextvars.ContextVar("aduan_trace", default=None)
+
+
+# ====== HISTOGRAM & COUNTER ======
+def observe(stage, seconds, rows=0):
+    if not ENABLED:
+        return
+    with _lock:
+        h = _hist.get(stage)
+        if h is None:
+            h = _hist[stage] = [[0] * (len(BUCKETS) + 1), 0.0, 0]
+        h[0][bisect.bisect_left(BUCKETS, seconds)] += 1
+        h[1] += seconds
+        h[2] += 1
+        if rows:
+            _rows[stage] = _rows.get(stage, 0) + rows
+    tr = _trace.get()
+    if tr is not None:
+        tr.add(stage, seconds, rows)
+
+
+def inc(name, value=1):
+    if not ENABLED:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+class timer:
+    __slots__ = ("stage", "rows", "_t0")
+
+    def __init__(self, stage, rows=0):
+        self.stage = stage
+        self.rows = rows
+
+    def __enter__(self):
+        if ENABLED:
+            self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if ENABLED:
+            observe(self.stage, time.perf_counter() - self._t0, self.rows)
+        return False
+
+
+# ====== TRACE (rincian satu request / satu upload) ======
+class Trace:
+    def __init__(self, name, fields):
+        self.name = name
+        self.fields = fields
+        self.stages = {}    # tahap -> [detik, panggilan, baris]
+        self.t0 = time.perf_counter()
+        self.elapsed = None
+
+    def add(self, stage, seconds, rows):
+        s = self.stages.get(stage)
+        if s is None:
+            s = self.stages[stage] = [0.0, 0, 0]
+        s[0] += seconds
+        s[1] += 1
+        s[2] += rows
+
+    def as_dict(self):
+        return {
+            "event": self.name,
+            **self.fields,
+            "total_ms": round((self.elapsed or 0) * 1000, 2),
+            "stages_ms": {k: round(v[0] * 1000, 2) for k, v in self.stages.items()},
+        }
+
+    def rows(self):
+        return [
+            {"tahap": k, "ms": round(v[0] * 1000, 2), "panggilan": v[1], "baris": v[2] or None}
+            for k, v in self.stages.items()
+        ]
+
+
+def begin_trace(name, **fields):
+    if not ENABLED:
+        return None
+    tr = Trace(name, fields)
+    tr.token = _trace.set(tr)
+    return tr
+
+
+def end_trace(tr):
+    if tr is None:
+        return None
+    tr.elapsed = time.perf_counter() - tr.t0
+    try:
+        _trace.reset(tr.token)
+    except ValueError:
+        # Diakhiri dari context lain (mis. rerun Streamlit); cukup lepaskan
+        _trace.set(None)
+    observe(f"{tr.name}.total", tr.elapsed)
+    logger.info(json.dumps(tr.as_dict(), ensure_ascii=False))
+    if TEXTFILE:
+        write_textfile(TEXTFILE)
+    return tr
+
+
+# ====== MEMORI ======
+# Peak RSS (MB) proses ini; children=True: proses anak terbesar yang sudah
+# selesai (worker preprocessing terhitung setelah pool di-shutdown), bukan
+# jumlah semua worker. ru_maxrss dalam byte di macOS, KB di Linux/BSD.
+def peak_rss_mb(children=False):
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+    return round(rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024, 1)
+
+
+# ====== EKSPOR ======
+def snapshot():
+    with _lock:
+        return {
+            "stages": {
+                k: {"count": h[2], "sum_s": round(h[1], 6), "rows": _rows.get(k, 0)}
+                for k, h in sorted(_hist.items())
+            },
+            "counters": dict(sorted(_counters.items())),
+        }
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def render_prometheus(extra_gauges=None):
+    lines = [
+        "# HELP aduan_stage_seconds Durasi per tahap pipeline klasifikasi aduan",
+        "# TYPE aduan_stage_seconds histogram",
+    ]
+    with _lock:
+        hist = {k: ([*h[0]], h[1], h[2]) for k, h in sorted(_hist.items())}
+        rows = dict(sorted(_rows.items()))
+        counters = dict(sorted(_counters.items()))
+    for stage, (buckets, total, count) in hist.items():
+        cum = 0
+        for le, n in zip((*BUCKETS, "+Inf"), buckets):
+            cum += n
+            lines.append(f'aduan_stage_seconds_bucket{{stage="{_label(stage)}",le="{le}"}} {cum}')
+        lines.append(f'aduan_stage_seconds_sum{{stage="{_label(stage)}"}} {total:.6f}')
+        lines.append(f'aduan_stage_seconds_count{{stage="{_label(stage)}"}} {count}')
+    lines += [
+        "# HELP aduan_stage_rows_total Jumlah baris yang diproses per tahap",
+        "# TYPE aduan_stage_rows_total counter",
+    ]
+    lines += [f'aduan_stage_rows_total{{stage="{_label(k)}"}} {v}' for k, v in rows.items()]
+    for name, value in counters.items():
+        lines += [f"# TYPE aduan_{name}_total counter", f"aduan_{name}_total {value}"]
+    for name, value in (extra_gauges or {}).items():
+        lines += [f"# TYPE aduan_{name} gauge", f"aduan_{name} {value}"]
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(path):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(render_prometheus())
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning("metrik tidak bisa ditulis ke %s: %s", path, e)
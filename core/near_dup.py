@@ -0,0 +1,133 @@
+import numpy as np
+
+NUM_PERM = 64
+BANDS = 16            # 16 band x 4 baris: peluang jadi kandidat 50% di Jaccard ~0.5
+THRESHOLD = 0.7       # Jaccard minimum (dicek pada set shingle) agar dianggap near-duplikat
+SHINGLE_CHUNK = 200_000
+_MASK64 = (1 << 64) - 1
+
+
+# ====== SHINGLE ======
+# Shingle = token (unigram) + pasangan token berurutan dari text_cleaned.
+# Mention, emoji & tanda baca sudah hilang di preprocessing, jadi retweet yang
+# hanya beda satu mention/kata tambahan tetap punya set shingle yang mirip.
+def shingles(cleaned):
+    tokens = cleaned.split()
+    out = set(tokens)
+    out.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+    return out
+
+
+# Shingle -> id bilangan bulat lewat kamus (lebih murah dari hash string);
+# pengacakan dilakukan oleh fungsi hash MinHash
+def _shingle_ids(shingle_sets):
+    vocab = {}
+    ids = np.fromiter(
+        (vocab.setdefault(s, len(vocab)) for sh in shingle_sets for s in sh),
+        dtype=np.uint64,
+    )
+    indptr = np.zeros(len(shingle_sets) + 1, dtype=np.int64)
+    np.cumsum([len(sh) for sh in shingle_sets], out=indptr[1:])
+    return ids, indptr
+
+
+# ====== MINHASH ======
+# Keluarga hash multiply-shift: h(x) = ((a*x + b) mod 2^64) >> 32, a ganjil.
+# uint64 numpy wrap-around = mod 2^64, jadi satu perkalian matriks per chunk.
+class MinHasher:
+    def __init__(self, num_perm=NUM_PERM, seed=1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.a = rng.integers(1, _MASK64, size=num_perm, dtype=np.uint64, endpoint=True) | np.uint64(1)
+        self.b = rng.integers(0, _MASK64, size=num_perm, dtype=np.uint64, endpoint=True)
+
+    # Set shingle per dokumen -> signature (dokumen, num_perm) uint32.
+    # Dokumen tanpa shingle mendapat nilai maksimum (tidak pernah sama dengan yang lain).
+    def signatures(self, shingle_sets):
+        ids, indptr = _shingle_ids(shingle_sets)
+        sig = np.full((len(shingle_sets), self.num_perm), np.iinfo(np.uint32).max, dtype=np.uint32)
+        lengths = np.diff(indptr)
+        docs = np.flatnonzero(lengths)
+        start = 0
+        # Chunk per kelompok dokumen utuh supaya matriks hash tidak terlalu besar
+        while start < len(docs):
+            stop = np.searchsorted(indptr[docs], indptr[docs[start]] + SHINGLE_CHUNK, side="right")
+            stop = max(stop, start + 1)
+            part = docs[start:stop]
+            lo, hi = indptr[part[0]], indptr[part[-1] + 1]
+            with np.errstate(over="ignore"):
+                h = (ids[lo:hi, None] * self.a + self.b) >> np.uint64(32)
+            sig[part] = np.minimum.reduceat(h, indptr[part] - lo, axis=0).astype(np.uint32)
+            start = stop
+        return sig
+
+
+# ====== LSH + CLUSTER ======
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def jaccard(a, b):
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+# text_cleaned unik -> id cluster per teks (id = indeks anggota pertama).
+# Tiap band memetakan potongan signature ke bucket; anggota bucket hanya
+# dibandingkan dengan anggota pertama bucket (bukan semua pasangan), jadi
+# biaya tetap linear walau ada ribuan retweet di satu bucket. Pasangan
+# kandidat diverifikasi dengan Jaccard asli set shingle.
+def cluster(cleaned_texts, threshold=THRESHOLD, num_perm=NUM_PERM, bands=BANDS, hasher=None):
+    if num_perm % bands:
+        raise ValueError("num_perm harus habis dibagi bands")
+    sets = [shingles(c) for c in cleaned_texts]
+    sig = (hasher or MinHasher(num_perm)).signatures(sets)
+    rows = num_perm // bands
+    parent = list(range(len(sets)))
+    docs = np.flatnonzero([bool(s) for s in sets])
+    sig = sig[docs].astype(np.uint64)
+    for band in range(bands):
+        # Potongan band digabung ke satu uint64 (tabrakan hash tidak masalah
+        # karena kandidat tetap diverifikasi Jaccard)
+        key = np.zeros(len(docs), dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            for col in sig[:, band * rows:(band + 1) * rows].T:
+                key = key * np.uint64(0x9E3779B97F4A7C15) + col
+        _, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+        head = first[inverse]
+        for i, h in zip(docs[head != np.arange(len(docs))].tolist(),
+                        docs[head[head != np.arange(len(docs))]].tolist()):
+            ri, rh = _find(parent, i), _find(parent, h)
+            if ri != rh and jaccard(sets[i], sets[h]) >= threshold:
+                parent[max(ri, rh)] = min(ri, rh)
+    return np.fromiter((_find(parent, i) for i in range(len(sets))), dtype=np.int64, count=len(sets))
+
+
+# ====== LAPORAN ======
+# Baris upload -> id cluster per baris (= baris pertama cluster, jadi
+# representatifnya) dan tabel cluster yang beranggota > 1 baris.
+def near_duplicates(df, threshold=THRESHOLD):
+    import pandas as pd
+
+    codes, uniques = pd.factorize(df["text_cleaned"], sort=False)
+    first_row = np.full(len(uniques), len(df), dtype=np.int64)
+    np.minimum.at(first_row, codes, np.arange(len(df)))
+    # factorize mengikuti urutan kemunculan, jadi akar cluster = teks unik paling awal
+    root = cluster(list(uniques), threshold)
+    row_cluster = first_row[root[codes]]
+
+    sizes = np.bincount(row_cluster, minlength=len(df))
+    variants = np.bincount(root, minlength=len(uniques))
+    reps = np.flatnonzero(sizes > 1)
+    table = pd.DataFrame({
+        "Contoh Kalimat": df["text_cleaned"].to_numpy()[reps],
+        "Text_Asli": df["text"].to_numpy()[reps],
+        "Label": df["label"].to_numpy()[reps],
+        "Jumlah_Duplikat": sizes[reps],
+        "Variasi": variants[codes[reps]],
+    }).sort_values("Jumlah_Duplikat", ascending=False, kind="stable").reset_index(drop=True)
+    return row_cluster, table
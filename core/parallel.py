@@ -0,0 +1,174 @@
+import atexit
+import math
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from core import metrics, registry
+from core.preprocess import preprocess_tokens
+
+# Di bawah jumlah baris ini biaya kirim data ke worker lebih mahal dari prosesnya
+MIN_PARALLEL_ROWS = 2000
+SHARDS_PER_WORKER = 4
+# Tiap worker memuat normalizer + stemmer sendiri; default dibatasi supaya
+# server dengan banyak core tidak membuat satu proses per core
+MAX_DEFAULT_WORKERS = 4
+
+
+def default_workers():
+    env = os.environ.get("ADUAN_PREPROCESS_WORKERS")
+    if env:
+        return max(1, int(env))
+    return min(os.cpu_count() or 1, MAX_DEFAULT_WORKERS)
+
+
+# Jumlah worker yang dipakai untuk satu batch: minimal MIN_PARALLEL_ROWS baris
+# per worker, jadi batch kecil tidak menyalakan semua proses
+def batch_workers(n_rows, workers):
+    return max(1, min(workers, n_rows // MIN_PARALLEL_ROWS))
+
+
+# ====== STATE DI DALAM WORKER (diisi sekali oleh initializer) ======
+_worker = {}
+
+
+def _init_worker():
+    # Worker membaca model/pipeline.json sendiri, jadi konfigurasinya sama dengan induk.
+    # Hanya normalizer + stemmer yang dimuat (bukan registry.warm_up).
+    _worker["normalizer"] = registry.get_normalizer()
+    _worker["stemmer"] = registry.get_stemmer() if registry.get_spec()["stem"] else None
+
+
+# -> (token per teks, detik normalisasi+tokenisasi, detik stemming).
+# Waktu per tahap hanya diukur bila metrik aktif.
+def _preprocess_texts(texts, normalizer, stemmer, timed):
+    if not timed:
+        return [preprocess_tokens(t, normalizer, stemmer) for t in texts], 0.0, 0.0
+    clock = time.perf_counter
+    tokens = []
+    t_norm = t_stem = 0.0
+    for text in texts:
+        t0 = clock()
+        toks = normalizer.tokens(text)
+        t1 = clock()
+        if stemmer is not None:
+            toks = [stemmer.stem(w) for w in toks]
+            t_stem += clock() - t1
+        t_norm += t1 - t0
+        tokens.append(toks)
+    return tokens, t_norm, t_stem
+
+
+# -> (token, detik normalisasi, detik stem, hit cache stem, miss cache stem);
+# hit/miss per shard dikirim balik karena counter StemCache hidup di worker
+def _run_shard(texts, timed=False):
+    stemmer = _worker["stemmer"]
+    hits, misses = (stemmer.hits, stemmer.misses) if stemmer is not None else (0, 0)
+    tokens, t_norm, t_stem = _preprocess_texts(texts, _worker["normalizer"], stemmer, timed)
+    if stemmer is not None:
+        # atexit tidak jalan di worker pool, jadi simpan cache stem per shard
+        stemmer.flush()
+        hits, misses = stemmer.hits - hits, stemmer.misses - misses
+    return tokens, t_norm, t_stem, hits, misses
+
+
+# ====== POOL (dipakai ulang selama proses hidup) ======
+_lock = threading.Lock()
+_pools = {}
+
+
+# "forkserver" (atau "spawn" bila tidak ada, mis. Windows) aman dipakai dari
+# proses ber-thread seperti server Streamlit. Server fork memuat core.parallel
+# sekali, worker di-fork dari situ; skrip utama tidak ikut di-preload.
+def _mp_context():
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(["core.parallel"])
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+def _get_pool(workers):
+    key = (workers, registry.get_spec()["version"])
+    with _lock:
+        pool = _pools.get(key)
+        if pool is None:
+            # Konfigurasi berubah: pool lama berhenti menerima tugas, tetapi map
+            # yang masih berjalan di sesi lain dibiarkan selesai lebih dulu
+            for old in _pools.values():
+                old.shutdown(wait=False)
+            _pools.clear()
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=_mp_context(),
+                initializer=_init_worker,
+            )
+            _pools[key] = pool
+        return pool
+
+
+def shutdown():
+    with _lock:
+        for pool in _pools.values():
+            pool.shutdown(wait=True, cancel_futures=True)
+        _pools.clear()
+
+
+atexit.register(shutdown)
+
+
+# ====== HIT RATE CACHE STEM (proses ini + semua worker) ======
+_stem_lock = threading.Lock()
+_worker_stem = {"hits": 0, "misses": 0}
+
+
+def stem_cache_stats():
+    if not registry.get_spec()["stem"]:
+        return None
+    own = registry.get_stemmer().stats()
+    with _stem_lock:
+        hits = own["hits"] + _worker_stem["hits"]
+        misses = own["misses"] + _worker_stem["misses"]
+    total = hits + misses
+    return {"hits": hits, "misses": misses, "hit_rate": hits / total if total else 0.0}
+
+
+def preprocess_parallel(texts, workers=None, shard_size=None):
+    texts = list(texts)
+    workers = workers if workers is not None else default_workers()
+    stem = registry.get_spec()["stem"]
+    timed = metrics.ENABLED
+
+    with metrics.timer("preprocess", len(texts)):
+        if batch_workers(len(texts), workers) <= 1:
+            normalizer = registry.get_normalizer()
+            stemmer = registry.get_stemmer() if stem else None
+            tokens, t_norm, t_stem = _preprocess_texts(texts, normalizer, stemmer, timed)
+        else:
+            if shard_size is None:
+                shard_size = math.ceil(len(texts) / (batch_workers(len(texts), workers) * SHARDS_PER_WORKER))
+            shards = [texts[i:i + shard_size] for i in range(0, len(texts), shard_size)]
+            pool = _get_pool(workers)
+
+            # pool.map menjaga urutan shard, jadi hasil tersusun sesuai urutan input.
+            # Waktu normalize/stem dari worker dijumlahkan (detik CPU, bukan wall).
+            tokens = []
+            t_norm = t_stem = 0.0
+            hits = misses = 0
+            for part, n, s, h, m in pool.map(_run_shard, shards, [timed] * len(shards)):
+                tokens.extend(part)
+                t_norm += n
+                t_stem += s
+                hits += h
+                misses += m
+            with _stem_lock:
+                _worker_stem["hits"] += hits
+                _worker_stem["misses"] += misses
+    if timed:
+        # normalize = slang + tokenisasi + stopword (satu lintasan Normalizer)
+        metrics.observe("normalize", t_norm, len(texts))
+        if stem:
+            metrics.observe("stem", t_stem, len(texts))
+    return tokens
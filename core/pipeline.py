@@ -0,0 +1,39 @@
+import json
+import os
+
+BASE_DIR  = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SPEC_PATH = os.path.join(BASE_DIR, "model", "pipeline.json")
+SPEC_VERSION = 1
+
+# ====== SPEC PIPELINE ======
+# Konfigurasi preprocessing + model disimpan di model/pipeline.json di samping
+# artefak model, jadi halaman sentiment, halaman input dan tool lain memakai
+# fitur yang sama. Naikkan "version" setiap kali isi spec berubah.
+_REQUIRED = ("version", "vectorizer", "model", "keywords", "slang", "stem", "stopwords", "threshold")
+
+
+def load_spec(path=SPEC_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        spec = json.load(f)
+    if spec.get("spec_version") != SPEC_VERSION:
+        raise ValueError(
+            f"{path}: spec_version {spec.get('spec_version')!r} tidak didukung (harus {SPEC_VERSION})"
+        )
+    missing = [k for k in _REQUIRED if k not in spec]
+    if missing:
+        raise ValueError(f"{path}: field wajib tidak ada: {', '.join(missing)}")
+    return spec
+
+
+def resolve_path(path):
+    return path if os.path.isabs(path) else os.path.join(BASE_DIR, path)
+
+
+def build_stop_words(spec, words_for_language):
+    sw = spec["stopwords"]
+    words = set()
+    for lang in sw.get("languages", ()):
+        words.update(words_for_language(lang))
+    words.update(sw.get("add", ()))
+    words.difference_update(sw.get("keep", ()))
+    return frozenset(words)
@@ -0,0 +1,186 @@
+import functools
+import re
+
+import nltk
+from nltk.tokenize import word_tokenize
+from nltk.tokenize.destructive import NLTKWordTokenizer
+
+from core.resources import ensure_nltk
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_DIGIT_RE = re.compile(r"\d+")
+
+
+# ==== Preprocessing untuk ML (versi NLTK, acuan paritas) ========
+def normalize_slang(text: str, slang_dict) -> str:
+    return " ".join(slang_dict.get(w, w) for w in word_tokenize(text.lower()))
+
+
+def reference_tokens(text: str, slang_dict, stop_words):
+    t = normalize_slang(text, slang_dict)
+    t = _PUNCT_RE.sub("", t)
+    t = _DIGIT_RE.sub("", t)
+    return [w for w in word_tokenize(t) if w not in stop_words]
+
+
+# ==== Normalizer satu lintasan ==================================
+# Meniru word_tokenize(text.lower()) -> slang -> hapus tanda baca/angka ->
+# word_tokenize -> stopword dalam satu regex. Karakter yang dipisah oleh
+# tokenizer NLTK menjadi token sendiri; sisanya membentuk "run" yang
+# diproses sekali lalu di-cache. Titik di akhir run hanya dipisah bila
+# Punkt menganggapnya akhir kalimat, jadi Punkt baru dipanggil kalau
+# hasilnya memang berbeda. Aturan apostrof NLTK dialihkan ke reference_tokens.
+_SPLIT = r";@#$%&?!*\[\](){}<>\"«»“”‘’„"
+_TOKEN_RE = re.compile(
+    r"\.{2,}|--|[" + _SPLIT + r"]|[:,](?!\d)"
+    r"|(?P<run>(?:[^\s" + _SPLIT + r":,.\-]|[:,](?=\d)|\.(?!\.)|-(?!-))+)"
+)
+# apostrof/backtick, ",," (koma memakan karakter berikutnya), ".:5" (batas kalimat)
+_FALLBACK_RE = re.compile(r"['`]|[:,][:,]|\.:\d")
+_FINAL_PERIOD_RE = NLTKWordTokenizer.PUNCTUATION[0][0]
+_CONTRACTIONS = NLTKWordTokenizer.CONTRACTIONS2
+_CONTRACTION_HINT = re.compile(r"(?i)can|gim|gon|got|lem|wan")
+
+DEFAULT_RUN_CACHE = 100_000
+
+
+def _split_contractions(run):
+    if _CONTRACTION_HINT.search(run) is None:
+        return run.split()
+    run = " " + run + " "
+    for regexp in _CONTRACTIONS:
+        run = regexp.sub(r" \1 \2 ", run)
+    return run.split()
+
+
+@functools.lru_cache(maxsize=1)
+def _punkt():
+    ensure_nltk()
+    return nltk.data.load("tokenizers/punkt/english.pickle")
+
+
+# Posisi titik yang dipisah NLTK sebagai titik akhir kalimat
+def _final_periods(lowered):
+    ends = set()
+    for start, end in _punkt().span_tokenize(lowered):
+        m = _FINAL_PERIOD_RE.search(lowered, start, end)
+        if m is not None:
+            ends.add(m.start(2))
+    return ends
+
+
+class Normalizer:
+    def __init__(self, slang_dict, stop_words, cache_size=DEFAULT_RUN_CACHE):
+        self.slang_dict = slang_dict
+        self.stop_words = frozenset(stop_words)
+        self._run_tokens = functools.lru_cache(maxsize=cache_size)(self._process_run)
+
+    # Satu token hasil tokenisasi pertama -> token akhir (sudah tanpa stopword)
+    def _clean_token(self, tok):
+        v = self.slang_dict.get(tok, tok)
+        v = _DIGIT_RE.sub("", _PUNCT_RE.sub("", v))
+        return [w for piece in v.split() for w in _split_contractions(piece)
+                if w not in self.stop_words]
+
+    def _clean_pieces(self, pieces):
+        return [w for p in pieces for w in self._clean_token(p)]
+
+    # -> (token bila titik akhir tidak dipisah, token bila dipisah / None kalau sama)
+    def _process_run(self, run):
+        plain = self._clean_pieces(_split_contractions(run))
+        if len(run) > 1 and run[-1] == "." and run[-2] != ".":
+            split = self._clean_pieces(_split_contractions(run[:-1]) + ["."])
+            if split != plain:
+                return tuple(plain), tuple(split)
+        return tuple(plain), None
+
+    def tokens(self, text: str):
+        lowered = text.lower()
+        if _FALLBACK_RE.search(lowered) is None:
+            out = []
+            finals = None
+            for m in _TOKEN_RE.finditer(lowered):
+                if m.group("run") is None:
+                    out.extend(self._clean_token(m.group()))
+                    continue
+                plain, split = self._run_tokens(m.group())
+                if split is not None:
+                    if '"' in lowered:
+                        # '"' diubah NLTK jadi `` sebelum aturan titik akhir
+                        break
+                    if finals is None:
+                        finals = _final_periods(lowered)
+                    if m.end() - 1 in finals:
+                        plain = split
+                out.extend(plain)
+            else:
+                return out
+        return reference_tokens(text, self.slang_dict, self.stop_words)
+
+
+def preprocess_tokens(text: str, normalizer, stemmer=None):
+    tokens = normalizer.tokens(text)
+    if stemmer is not None:
+        tokens = [stemmer.stem(w) for w in tokens]
+    return tokens
+
+
+# Token yang dilihat word_tokenize pada teks bersih. Hasil stem bisa kosong
+# atau berisi spasi ("tv_one" -> "tv one"), jadi dipecah ulang di sini.
+def feature_tokens(tokens):
+    return [w for t in tokens for w in _split_contractions(t)]
+
+
+# ==== Cek paritas Normalizer vs versi NLTK ======================
+# Kasus tanda baca & slang yang menyentuh tiap cabang Normalizer (titik akhir
+# kalimat, "..", "--", kutip, apostrof, ":"/"," sebelum angka, kontraksi NLTK)
+PARITY_CASES = [
+    "Jl. Ahmad Yani macet parah!!! gak gerak sama sekali...",
+    "lampu merah mati -- tlg dicek min. Makasih.",
+    "bus telat 30 menit, jam 07:15 blm datang",
+    "\"jalan rusak\" kata warga, tp blm diperbaiki",
+    "it's rosak bgt, can't lewat",
+    "ada lubang,,besar di jl.raya darmo.:5 motor jatuh",
+    "cannot gimme gonna wanna lemme gotta",
+    "harga 1.500,00 rupiah?! (parkir liar) @dishub_sby #macet",
+    "waduh... hadeh!! kecelakaan lagi di sby.",
+    "trotoar dipakai parkir; pejalan kaki susah lewat :( ",
+    "ok.ok. y. g. iye",
+    "«banjir» di bundaran 'waru' sampai 50cm",
+]
+
+
+def check_parity(texts, slang_dict, stop_words):
+    normalizer = Normalizer(slang_dict, stop_words)
+    return [
+        t for t in texts
+        if normalizer.tokens(t) != reference_tokens(t, slang_dict, stop_words)
+    ]
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+
+    import pandas as pd
+
+    from core import registry
+
+    parser = argparse.ArgumentParser(description="Bandingkan Normalizer dengan preprocessing NLTK")
+    parser.add_argument("csv", nargs="?", default="source/data-20rb.csv",
+                        help="CSV berisi teks (bila tidak ada: teks contoh + PARITY_CASES)")
+    parser.add_argument("--column", default="text")
+    args = parser.parse_args()
+
+    if os.path.exists(args.csv):
+        texts = pd.read_csv(args.csv)[args.column].fillna("").astype(str).tolist()
+    else:
+        from core.loadgen import SAMPLE_TEXTS
+        print(f"{args.csv} tidak ada, pakai teks contoh + kasus tanda baca/slang")
+        texts = list(SAMPLE_TEXTS) + PARITY_CASES
+    stop_words = registry.get_stop_words()
+    diff = check_parity(texts, registry.get_slang_dict(), stop_words)
+    print(f"{len(texts) - len(diff)}/{len(texts)} teks identik")
+    for t in diff[:20]:
+        print("  beda:", repr(t))
+    raise SystemExit(1 if diff else 0)
@@ -0,0 +1,288 @@
+import logging
+import os
+import threading
+
+from core import metrics, pipeline
+
+logger = logging.getLogger(__name__)
+
+# ====== KONFIGURASI PATH ======
+BASE_DIR = pipeline.BASE_DIR
+# Kosongkan ADUAN_STEM_CACHE untuk cache stem di memori saja
+STEM_CACHE_PATH = os.environ.get(
+    "ADUAN_STEM_CACHE", os.path.join(BASE_DIR, ".cache", "stem-cache.sqlite3")
+)
+# Cache hasil prediksi di memori saja, kecuali ADUAN_RESULT_CACHE diisi path
+# sqlite (mis. .cache/result-cache.sqlite3) untuk menyimpannya ke disk
+RESULT_CACHE_PATH = os.environ.get("ADUAN_RESULT_CACHE") or None
+
+# Batas cache hasil upload halaman input (dipakai bersama semua sesi)
+UPLOAD_CACHE_ENTRIES = int(os.environ.get("ADUAN_UPLOAD_CACHE_ENTRIES", "8"))
+UPLOAD_CACHE_MB = float(os.environ.get("ADUAN_UPLOAD_CACHE_MB", "512"))
+
+# ====== REGISTRY SATU PROSES ======
+# Semua asset disimpan sekali per proses; Streamlit rerun / ganti halaman
+# cukup mengambil objek yang sudah ada, bukan joblib.load ulang.
+_lock = threading.RLock()
+_assets = {}
+_locks = {}
+_reported = False
+
+
+# Satu lock per asset: loader yang lambat (mis. stemmer) tidak menahan
+# getter lain yang tidak bergantung padanya. Loader yang mengembalikan None
+# (file opsional belum ada) juga diingat, jadi rerun tidak mencoba lagi.
+_ABSENT = object()
+
+
+def _get(name, loader):
+    asset = _assets.get(name)
+    if asset is None:
+        with _lock:
+            lock = _locks.setdefault(name, threading.RLock())
+        with lock:
+            asset = _assets.get(name)
+            if asset is None:
+                with metrics.timer(f"load.{name}"):
+                    asset = loader()
+                asset = _ABSENT if asset is None else asset
+                _assets[name] = asset
+    return None if asset is _ABSENT else asset
+
+
+def _load_slang_dict(path):
+    d = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if ":" in line:
+                    k, v = line.strip().split(":")
+                    d[k] = v
+    except:
+        pass
+    return d
+
+
+def _stopwords_for(lang):
+    from nltk.corpus import stopwords
+    from core.resources import ensure_nltk
+    ensure_nltk()
+    return stopwords.words(lang)
+
+
+def _load_stemmer():
+    from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+    from core.stem_cache import StemCache
+    return StemCache(StemmerFactory().create_stemmer(), path=STEM_CACHE_PATH or None)
+
+
+def get_spec():
+    return _get("spec", pipeline.load_spec)
+
+
+def _spec_path(key):
+    return pipeline.resolve_path(get_spec()[key])
+
+
+# Ekspor native (python -m core.export) dipakai bila ada; pickle jadi cadangan
+def _native_dir():
+    native = get_spec().get("native")
+    if native:
+        path = pipeline.resolve_path(native)
+        if os.path.exists(os.path.join(path, "manifest.json")):
+            return path
+        logger.warning("ekspor native %s belum ada, memakai pickle", path)
+    return None
+
+
+def _load_vectorizer():
+    native = _native_dir()
+    if native:
+        from core.export import load_native_vectorizer
+        return load_native_vectorizer(native)
+    import joblib
+    from core.vectorizer import VocabVectorizer
+    return VocabVectorizer.from_sklearn(joblib.load(_spec_path("vectorizer")))
+
+
+def _load_booster_model():
+    native = _native_dir()
+    if native:
+        from core.export import load_native_model
+        return load_native_model(native)
+    import joblib
+    return joblib.load(_spec_path("model"))
+
+
+# "engine" di spec: "xgboost" (default), "numpy" (core.tree_engine, tanpa
+# import xgboost) atau "auto" (numpy untuk batch kecil, xgboost untuk besar)
+def _load_xgb_model():
+    engine = get_spec().get("engine", "xgboost")
+    if engine not in ("xgboost", "numpy", "auto"):
+        raise ValueError(f"engine {engine!r} tidak dikenal (xgboost | numpy | auto)")
+    native = _native_dir() if engine != "xgboost" else None
+    if native is None:
+        if engine != "xgboost":
+            logger.warning("engine %s butuh ekspor native, memakai xgboost", engine)
+        return _load_booster_model()
+    from core.tree_engine import AutoModel, load_tree_model
+    trees = load_tree_model(native)
+    return trees if engine == "numpy" else AutoModel(trees, _load_booster_model)
+
+
+def get_vectorizer():
+    return _get("vectorizer", _load_vectorizer)
+
+
+def get_xgb_model():
+    return _get("xgb_model", _load_xgb_model)
+
+
+def get_aduan_keywords():
+    from core.keywords import load_keywords
+    return _get("aduan_keywords", lambda: frozenset(load_keywords(_spec_path("keywords"))))
+
+
+def get_keyword_index():
+    from core.keywords import KeywordIndex
+    return _get("keyword_index", lambda: KeywordIndex(get_aduan_keywords(), get_vectorizer()))
+
+
+def get_regex_booster():
+    from core.regex_booster import DEFAULT_MAX_GAP, RegexBooster
+    cfg = get_spec().get("booster") or {}
+    return _get(
+        "regex_booster",
+        lambda: RegexBooster.from_file(
+            pipeline.resolve_path(cfg.get("path", "source/booster.json")),
+            cfg.get("max_gap", DEFAULT_MAX_GAP),
+        )
+    )
+
+
+def _load_severity_scorer():
+    from core.severity import SeverityScorer, compile_lexicon, lexicon_key, load_lexicon
+    terms = None
+    native = _native_dir()
+    if native:
+        from core.export import load_severity_terms
+        terms = load_severity_terms(native, lexicon_key(get_spec()))
+    if terms is None:
+        # Tanpa hasil ekspor: stem leksikon di sini (lambat bila cache stem dingin)
+        logger.warning("leksikon severity belum diekspor, dikompilasi saat dimuat")
+        cfg = get_spec()["severity"]
+        stemmer = get_stemmer() if get_spec()["stem"] else None
+        terms = compile_lexicon(load_lexicon(pipeline.resolve_path(cfg["lexicon"])), get_normalizer(), stemmer)
+    return SeverityScorer(terms, get_vectorizer())
+
+
+def get_severity_scorer():
+    # None bila spec tidak punya blok "severity"
+    if not get_spec().get("severity"):
+        return None
+    return _get("severity_scorer", _load_severity_scorer)
+
+
+def _load_evaluation():
+    native = _native_dir()
+    if native is None:
+        return None
+    from core.evaluate import load_evaluation
+    return load_evaluation(native)
+
+
+def get_evaluation():
+    # Hasil python -m core.evaluate (None bila belum ada); dibaca sekali per proses
+    return _get("evaluation", _load_evaluation)
+
+
+def get_dataset():
+    # Viewer dataset halaman about (Arrow memory-mapped); None bila CSV belum ada
+    from core.dataset import load_dataset
+    return _get("dataset", load_dataset)
+
+
+def get_slang_dict():
+    return _get("slang_dict", lambda: _load_slang_dict(_spec_path("slang")))
+
+
+def get_stop_words():
+    # Stopword sesuai spec (bahasa + tambahan - kata yang dipertahankan)
+    return _get("stop_words", lambda: pipeline.build_stop_words(get_spec(), _stopwords_for))
+
+
+def get_stemmer():
+    return _get("stemmer", _load_stemmer)
+
+
+def get_result_cache():
+    # Dipakai bersama halaman sentiment, halaman input, service dan CLI
+    from core.result_cache import ResultCache
+    return _get(
+        "result_cache",
+        lambda: ResultCache(get_spec()["version"], path=RESULT_CACHE_PATH or None)
+    )
+
+
+def get_upload_cache():
+    from core.upload_cache import UploadCache
+    return _get(
+        "upload_cache",
+        lambda: UploadCache(get_spec()["version"], UPLOAD_CACHE_ENTRIES, UPLOAD_CACHE_MB)
+    )
+
+
+def get_normalizer():
+    # Satu Normalizer per proses, supaya cache token-nya bertahan antar rerun
+    from core.preprocess import Normalizer
+    return _get("normalizer", lambda: Normalizer(get_slang_dict(), get_stop_words()))
+
+
+# ====== LAPORAN MEMORI (sekali per proses) ======
+def report_memory():
+    global _reported
+    with _lock:
+        if _reported:
+            return
+        _reported = True
+    native = _native_dir()
+    if native:
+        from core.export import native_files
+        files = native_files(native)
+    else:
+        files = (_spec_path("vectorizer"), _spec_path("model"))
+    sizes = {os.path.basename(p): os.path.getsize(p) for p in files if os.path.exists(p)}
+    rss = metrics.peak_rss_mb()
+    logger.info(
+        "model registry loaded (pipeline %s): %s | assets=%s | peak RSS=%s",
+        get_spec()["version"],
+        ", ".join(f"{k} ({v / 1024:.0f} KB)" for k, v in sizes.items()),
+        sorted(str(k) for k in _assets),
+        f"{rss:.1f} MB" if rss is not None else "n/a",
+    )
+
+
+# ====== WARM-UP ======
+_warm_thread = None
+
+
+def warm_up(background=False):
+    global _warm_thread
+
+    def _run():
+        get_vectorizer()
+        get_xgb_model()
+        get_keyword_index()
+        get_normalizer()
+        if get_spec()["stem"]:
+            get_stemmer()
+        get_severity_scorer()
+        report_memory()
+
+    if not background:
+        _run()
+        return
+    with _lock:
+        if _warm_thread is None:
+            _warm_thread = threading.Thread(target=_run, name="model-warm-up", daemon=True)
+            _warm_thread.start()
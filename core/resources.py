@@ -0,0 +1,98 @@
+import logging
+import os
+import threading
+
+from core import pipeline
+
+logger = logging.getLogger(__name__)
+
+# ====== DATA NLTK (offline) ======
+# Data NLTK dicari di nltk_data/ repo, ADUAN_NLTK_DATA, lalu path bawaan NLTK.
+# Pengecekan cukup sekali per proses. Bila data belum ada (deploy baru), data
+# diunduh sekali ke folder pertama yang bisa ditulis; setup offline cukup
+# menjalankan `python -m core.resources --download` sebelumnya.
+NLTK_DIRS = [
+    p for p in (os.environ.get("ADUAN_NLTK_DATA"), os.path.join(pipeline.BASE_DIR, "nltk_data")) if p
+]
+NLTK_RESOURCES = {
+    "punkt": "tokenizers/punkt",
+    "stopwords": "corpora/stopwords",
+}
+
+_lock = threading.Lock()
+_checked = False
+
+
+def _missing():
+    import nltk
+
+    for d in reversed(NLTK_DIRS):
+        if d not in nltk.data.path:
+            nltk.data.path.insert(0, d)
+    missing = []
+    for name, path in NLTK_RESOURCES.items():
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            missing.append(name)
+    return missing
+
+
+def ensure_nltk():
+    global _checked
+    if _checked:
+        return
+    with _lock:
+        if _checked:
+            return
+        missing = _missing()
+        if missing:
+            logger.warning("data NLTK belum ada (%s), mengunduh sekali", ", ".join(missing))
+            try:
+                download_nltk()
+            except OSError:
+                logger.exception("unduhan data NLTK gagal")
+            missing = _missing()
+        if missing:
+            raise LookupError(
+                f"data NLTK tidak ditemukan: {', '.join(missing)}. Jalankan sekali "
+                f"`python -m core.resources --download` (atau set ADUAN_NLTK_DATA)"
+            )
+        _checked = True
+
+
+def _writable_dir():
+    for d in NLTK_DIRS:
+        try:
+            os.makedirs(d, exist_ok=True)
+        except OSError:
+            continue
+        if os.access(d, os.W_OK):
+            return d
+    return None
+
+
+def download_nltk(target=None):
+    import nltk
+
+    target = target or _writable_dir()
+    for name in NLTK_RESOURCES:
+        if not nltk.download(name, download_dir=target, quiet=True):
+            raise OSError(f"gagal mengunduh data NLTK {name!r}")
+    return target
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Cek / unduh data NLTK yang dipakai preprocessing")
+    parser.add_argument("--download", action="store_true", help="unduh data yang belum ada")
+    parser.add_argument("--dir", help="folder tujuan unduhan (default: nltk_data/ di repo)")
+    args = parser.parse_args()
+
+    missing = _missing()
+    if missing and args.download:
+        print(f"mengunduh {', '.join(missing)} ke {download_nltk(args.dir)}")
+        missing = _missing()
+    print("data NLTK lengkap" if not missing else f"belum ada: {', '.join(missing)}")
+    raise SystemExit(1 if missing else 0)
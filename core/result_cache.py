@@ -0,0 +1,88 @@
+import hashlib
+
+from core.sqlite_cache import SqliteLRU
+
+DEFAULT_MAXSIZE = 100_000
+
+
+def cache_key(text):
+    # Preprocessing hanya melihat text.lower(), jadi teks yang beda kapital
+    # pasti menghasilkan prediksi yang sama. Yang disimpan hanya hash-nya,
+    # teks aduan asli tidak pernah masuk cache (juga tidak ke sqlite).
+    return hashlib.blake2b(text.lower().encode("utf-8"), digest_size=16).hexdigest()
+
+
+# ====== CACHE HASIL PREDIKSI ======
+# (versi pipeline, hash teks ter-normalisasi) -> (prob, label, text_cleaned).
+# LRU terbatas di memori dengan counter hit/miss; bila `path` diisi, hasil
+# juga ditulis ke sqlite supaya proses baru (rerun server, CLI) langsung hangat.
+# Versi pipeline ikut di key, jadi ganti model/spec otomatis membuat cache baru.
+# Batas maxsize tabel sqlite berlaku untuk semua versi sekaligus.
+class ResultCache(SqliteLRU):
+    NAME = "result cache"
+    TABLE = "result_keys"
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS result_keys ("
+        "version TEXT NOT NULL, key TEXT NOT NULL, prob REAL NOT NULL, "
+        "label INTEGER NOT NULL, cleaned TEXT NOT NULL, PRIMARY KEY (version, key))"
+    )
+    INSERT = "INSERT OR REPLACE INTO result_keys (version, key, prob, label, cleaned) VALUES (?, ?, ?, ?, ?)"
+
+    def __init__(self, version, maxsize=DEFAULT_MAXSIZE, path=None):
+        self.version = version
+        self.batch_rows = 0
+        self.batch_scored = 0
+        super().__init__(maxsize, path)
+
+    # Tabel "results" lama berisi teks asli sebagai key: dibuang
+    def _create(self, db):
+        with db:
+            db.execute("DROP TABLE IF EXISTS results")
+            db.execute(self.SCHEMA)
+
+    def _load_rows(self, db):
+        rows = db.execute(
+            "SELECT key, prob, label, cleaned FROM result_keys WHERE version = ? "
+            "ORDER BY rowid DESC LIMIT ?", (self.version, self.maxsize)
+        ).fetchall()
+        return [((self.version, key), (prob, label, cleaned)) for key, prob, label, cleaned in rows]
+
+    def _db_rows(self, pending):
+        return [(v, t, *r) for (v, t), r in pending.items()]
+
+    # ---- lookup / simpan ----
+    # keys dari cache_key(); hasil None untuk yang belum ada
+    def get_many(self, keys):
+        with self._lock:
+            return [self._get_locked((self.version, key)) for key in keys]
+
+    def put_many(self, items):
+        with self._lock:
+            for key, result in items:
+                self._put_locked((self.version, key), result)
+
+    def get(self, key):
+        return self.get_many([key])[0]
+
+    def put(self, key, result):
+        self.put_many([(key, result)])
+
+    # Baris batch yang masuk vs text_cleaned unik yang benar-benar di-score
+    def record_batch(self, rows, scored):
+        with self._lock:
+            self.batch_rows += rows
+            self.batch_scored += scored
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self._pending.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "version": self.version,
+                **self._stats_locked(),
+                "batch_rows": self.batch_rows,
+                "batch_scored": self.batch_scored,
+            }
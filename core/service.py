@@ -0,0 +1,267 @@
+import argparse
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
+from core import metrics, registry
+from core.inference import LABEL_NAMES, predict_batch, severity_scores
+from core.parallel import stem_cache_stats
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY = 10 * 1024 * 1024
+MAX_BATCH_TEXTS = 50_000
+# /predict_batch diproses per potongan ini di thread inference yang sama;
+# micro-batch /predict yang antre bisa jalan di sela potongan
+BATCH_CHUNK_TEXTS = 512
+
+
+# ====== MICRO-BATCHER ======
+# Request /predict yang datang bersamaan ditampung sebentar (max_wait_ms) lalu
+# diskor sekaligus dengan satu predict_proba. Inference jalan di thread
+# terpisah supaya event loop tetap melayani koneksi.
+class MicroBatcher:
+    def __init__(self, executor, max_batch=64, max_wait_ms=5.0):
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.batches = 0
+        self.items = 0
+        self._queue = asyncio.Queue()
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+
+    async def submit(self, text):
+        fut = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, fut))
+        return await fut
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            texts = [t for t, _ in batch]
+            try:
+                results = await loop.run_in_executor(self.executor, _predict, texts)
+            except Exception as e:
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+                continue
+            self.batches += 1
+            self.items += len(batch)
+            for (_, fut), res in zip(batch, results):
+                if not fut.done():
+                    fut.set_result(res)
+
+
+def _predict(texts):
+    cleaned, prob, label = predict_batch(texts, workers=1)
+    severity = severity_scores(cleaned)
+    severity = severity.tolist() if severity is not None else [None] * len(texts)
+    return [
+        {"label": LABEL_NAMES[int(l)], "prob_aduan": float(p), "severity": v, "text_cleaned": c}
+        for c, p, v, l in zip(cleaned, prob, severity, label)
+    ]
+
+
+# ====== HTTP/1.1 MINIMAL (stdlib asyncio) ======
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+async def _read_request(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, path, version = lines[0].split(" ", 2)
+    except ValueError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "request line tidak valid")
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            k, v = line.split(":", 1)
+            headers[k.strip().lower()] = v.strip()
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Content-Length tidak valid")
+    if length < 0:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Content-Length tidak valid")
+    if length > MAX_BODY:
+        raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "body terlalu besar")
+    body = await reader.readexactly(length) if length else b""
+    keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+    return method, path.split("?", 1)[0], body, keep_alive
+
+
+# payload str dikirim apa adanya sebagai teks (format Prometheus), selain itu JSON
+def _write_response(writer, status, payload, keep_alive):
+    if isinstance(payload, str):
+        body = payload.encode("utf-8")
+        content_type = "text/plain; version=0.0.4; charset=utf-8"
+    else:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        content_type = "application/json; charset=utf-8"
+    writer.write(
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1")
+        + body
+    )
+
+
+def _json_body(body):
+    try:
+        payload = json.loads(body or b"{}")
+    except ValueError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "body harus JSON")
+    if not isinstance(payload, dict):
+        raise HttpError(HTTPStatus.BAD_REQUEST, "body harus objek JSON")
+    return payload
+
+
+class InferenceService:
+    def __init__(self, max_batch=64, max_wait_ms=5.0):
+        # Satu thread inference: batch diproses berurutan, tanpa rebutan GIL
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inference")
+        self.batcher = MicroBatcher(self.executor, max_batch, max_wait_ms)
+        self.started = time.time()
+
+    async def handle(self, method, path, body):
+        if path == "/health" and method == "GET":
+            return {
+                "status": "ok",
+                "pipeline_version": registry.get_spec()["version"],
+                "uptime_s": round(time.time() - self.started, 1),
+                "micro_batches": self.batcher.batches,
+                "micro_batched_items": self.batcher.items,
+                "result_cache": registry.get_result_cache().stats(),
+                "stem_cache": stem_cache_stats(),
+                "keyword_index": registry.get_keyword_index().stats(),
+            }
+        if path == "/metrics" and method == "GET":
+            cache = registry.get_result_cache().stats()
+            gauges = {
+                "micro_batches": self.batcher.batches,
+                "micro_batched_items": self.batcher.items,
+                "result_cache_entries": cache["size"],
+                "result_cache_hits": cache["hits"],
+                "result_cache_misses": cache["misses"],
+            }
+            stem = stem_cache_stats()
+            if stem is not None:
+                gauges.update({
+                    "stem_cache_hits": stem["hits"],
+                    "stem_cache_misses": stem["misses"],
+                    "stem_cache_hit_rate": round(stem["hit_rate"], 4),
+                })
+            return metrics.render_prometheus(gauges)
+        if path == "/predict":
+            if method != "POST":
+                raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "pakai POST")
+            text = _json_body(body).get("text")
+            if not isinstance(text, str):
+                raise HttpError(HTTPStatus.BAD_REQUEST, "field 'text' (string) wajib ada")
+            return await self.batcher.submit(text)
+        if path == "/predict_batch":
+            if method != "POST":
+                raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "pakai POST")
+            texts = _json_body(body).get("texts")
+            if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+                raise HttpError(HTTPStatus.BAD_REQUEST, "field 'texts' (list string) wajib ada")
+            if len(texts) > MAX_BATCH_TEXTS:
+                raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"maksimal {MAX_BATCH_TEXTS} teks")
+            loop = asyncio.get_running_loop()
+            results = []
+            for start in range(0, len(texts), BATCH_CHUNK_TEXTS):
+                results += await loop.run_in_executor(
+                    self.executor, _predict, texts[start:start + BATCH_CHUNK_TEXTS]
+                )
+            return {"results": results}
+        raise HttpError(HTTPStatus.NOT_FOUND, f"endpoint {path} tidak ada")
+
+    async def serve_client(self, reader, writer):
+        try:
+            while True:
+                try:
+                    method, path, body, keep_alive = await _read_request(reader)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    _write_response(writer, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                                    {"error": "header terlalu besar"}, False)
+                    await writer.drain()
+                    break
+                except (HttpError, ValueError) as e:
+                    # Request rusak / body terlalu besar: sisa stream tidak bisa
+                    # dibaca lagi, jadi balas lalu tutup koneksi
+                    status = e.status if isinstance(e, HttpError) else HTTPStatus.BAD_REQUEST
+                    _write_response(writer, status, {"error": str(e)}, False)
+                    await writer.drain()
+                    break
+                try:
+                    status, payload = HTTPStatus.OK, await self.handle(method, path, body)
+                except HttpError as e:
+                    status, payload = e.status, {"error": str(e)}
+                except Exception:
+                    logger.exception("gagal memproses %s %s", method, path)
+                    status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "internal error"}
+                _write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def run(self, host, port):
+        self.batcher.start()
+        server = await asyncio.start_server(self.serve_client, host, port)
+        logger.info("inference service di http://%s:%d (pipeline %s)",
+                    host, port, registry.get_spec()["version"])
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HTTP service klasifikasi aduan")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--max-batch", type=int, default=64,
+                        help="jumlah maksimal request /predict per micro-batch")
+    parser.add_argument("--max-wait-ms", type=float, default=5.0,
+                        help="lama menunggu request lain sebelum batch diskor")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    registry.warm_up()
+    service = InferenceService(args.max_batch, args.max_wait_ms)
+    try:
+        asyncio.run(service.run(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import hashlib
+import json
+
+import numpy as np
+
+from core import metrics, pipeline
+from core.preprocess import preprocess_tokens
+
+
+# ====== LEKSIKON SENTIMEN (source/sentiwords_id.txt, word:score) ======
+def load_lexicon(path):
+    lexicon = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            word, sep, score = line.strip().rpartition(":")
+            if sep and word:
+                lexicon[word] = int(score)
+    return lexicon
+
+
+# Kata leksikon diproses persis seperti teks (slang, stopword, stem) supaya
+# bentuknya sama dengan token text_cleaned. Yang hilang (stopword) atau jadi
+# lebih dari satu token diabaikan; beberapa kata yang jatuh ke stem yang sama
+# memakai rata-rata skornya.
+def compile_lexicon(lexicon, normalizer, stemmer=None):
+    scores = {}
+    for word, score in lexicon.items():
+        tokens = preprocess_tokens(word, normalizer, stemmer)
+        if len(tokens) == 1:
+            scores.setdefault(tokens[0], []).append(score)
+    return {term: float(np.mean(s)) for term, s in sorted(scores.items())}
+
+
+# Leksikon terkompilasi disimpan di ekspor native (python -m core.export),
+# satu "istilah<TAB>skor" per baris, supaya proses baru tidak perlu men-stem
+# ~1700 kata lagi. Kuncinya isi leksikon, kamus slang dan konfigurasi
+# stem/stopword; bila berbeda, leksikon dikompilasi ulang saat dimuat.
+def lexicon_key(spec):
+    h = hashlib.sha256()
+    for path in (spec["severity"]["lexicon"], spec["slang"]):
+        with open(pipeline.resolve_path(path), "rb") as f:
+            h.update(f.read())
+    h.update(json.dumps({k: spec[k] for k in ("stem", "stopwords")}, sort_keys=True).encode())
+    return h.hexdigest()
+
+
+def save_terms(terms, path):
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.writelines(f"{term}\t{score!r}\n" for term, score in terms.items())
+
+
+def load_terms(path):
+    terms = {}
+    with open(path, "r", encoding="utf-8", newline="\n") as f:
+        for line in f:
+            term, _, score = line.rstrip("\n").partition("\t")
+            terms[term] = float(score)
+    return terms
+
+
+# ====== SKOR SEVERITY ======
+# Bobot leksikon disejajarkan dengan kolom vocabulary vectorizer (istilah di
+# luar vocabulary jadi kolom bayangan, seperti KeywordIndex). Vectorizer di
+# sini cukup unigram: indeks kolomnya tetap indeks vocabulary model.
+# severity = -(X_biner @ bobot): makin besar makin negatif / mendesak,
+# negatif berarti nada teks positif.
+class SeverityScorer:
+    def __init__(self, terms, vectorizer):
+        from core.vectorizer import VocabVectorizer
+
+        vocab = vectorizer.vocabulary_
+        shadow = [t for t in terms if t not in vocab]
+        base = VocabVectorizer(
+            vocab, ngram_range=(1, 1), token_pattern=vectorizer.token_pattern,
+            lowercase=vectorizer.lowercase, binary=True, dtype=np.float32,
+        )
+        self.vectorizer = base.extended(shadow)
+        ext = self.vectorizer.vocabulary_
+        self.weights = np.zeros(len(ext), dtype=np.float32)
+        for term, score in terms.items():
+            if term in ext:
+                self.weights[ext[term]] = score
+        self.n_terms = sum(t in ext for t in terms)
+        self.n_in_vocab = self.n_terms - len(shadow)
+
+    def score_tokens(self, token_lists):
+        with metrics.timer("severity", len(token_lists)):
+            X = self.vectorizer.transform_tokens(token_lists)
+            # 0.0 - ...: teks tanpa istilah leksikon bernilai 0.0, bukan -0.0
+            return 0.0 - X @ self.weights
+
+    # text_cleaned -> severity; teks yang sama dihitung sekali
+    def score(self, cleaned_texts):
+        cleaned_texts = list(cleaned_texts)
+        unique = list(dict.fromkeys(cleaned_texts))
+        scores = dict(zip(unique, self.score_tokens([c.split() for c in unique]).tolist()))
+        return np.fromiter((scores[c] for c in cleaned_texts), dtype=np.float32, count=len(cleaned_texts))
+
+    def stats(self):
+        return {"terms": self.n_terms, "in_vocabulary": self.n_in_vocab}
@@ -0,0 +1,128 @@
+import atexit
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+FLUSH_EVERY = 256
+
+
+# ====== LRU DI MEMORI + TABEL SQLITE (basis StemCache & ResultCache) ======
+# LRU terbatas di memori dengan counter hit/miss. Bila `path` diisi, entri
+# baru ditampung di _pending lalu ditulis ke satu tabel sqlite tiap
+# FLUSH_EVERY entri (dan saat exit), sehingga proses/worker baru langsung hangat.
+# Subkelas mengisi NAME, TABLE, SCHEMA, INSERT dan _load_rows/_db_rows.
+class SqliteLRU:
+    NAME = "cache"
+    TABLE = None
+    SCHEMA = None
+    INSERT = None
+
+    def __init__(self, maxsize, path=None):
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._open(path)
+
+    def _create(self, db):
+        db.execute(self.SCHEMA)
+
+    # (key, value) terbaru dulu, paling banyak maxsize baris
+    def _load_rows(self, db):
+        raise NotImplementedError
+
+    # Baris INSERT untuk isi _pending
+    def _db_rows(self, pending):
+        raise NotImplementedError
+
+    # ---- persistensi ----
+    def _open(self, path):
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            db = sqlite3.connect(path, timeout=5, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            self._create(db)
+            rows = self._load_rows(db)
+        except sqlite3.Error as e:
+            logger.warning("%s %s tidak bisa dibuka (%s), pakai memori saja", self.NAME, path, e)
+            return
+        for key, value in reversed(rows):
+            self._cache[key] = value
+        self._db = db
+        atexit.register(self.flush)
+
+    # Tabel sqlite juga dibatasi maxsize: INSERT OR REPLACE memberi rowid baru,
+    # jadi baris dengan rowid di bawah (rowid terbesar - maxsize) yang terlama
+    def _flush_locked(self):
+        if self._db is None or not self._pending:
+            return
+        try:
+            with self._db:
+                self._db.executemany(self.INSERT, self._db_rows(self._pending))
+                self._db.execute(
+                    f"DELETE FROM {self.TABLE} WHERE rowid <= (SELECT max(rowid) FROM {self.TABLE}) - ?",
+                    (self.maxsize,)
+                )
+            self._pending.clear()
+        except sqlite3.Error as e:
+            # Biasanya "database is locked" dari worker lain; coba lagi di flush berikutnya.
+            # Antrian dibatasi maxsize (yang terlama dibuang, tetap ada di memori).
+            logger.debug("flush %s ditunda: %s", self.NAME, e)
+            for key in list(self._pending)[:max(0, len(self._pending) - self.maxsize)]:
+                del self._pending[key]
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    # ---- lookup / simpan (dipanggil dengan _lock dipegang) ----
+    def _get_locked(self, key):
+        value = self._cache.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self._cache.move_to_end(key)
+            self.hits += 1
+        return value
+
+    def _put_locked(self, key, value):
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+            self.evictions += 1
+        if self._db is not None:
+            self._pending[key] = value
+            if len(self._pending) >= FLUSH_EVERY:
+                self._flush_locked()
+
+    # Kosongkan cache di memori (isi sqlite tetap)
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def _stats_locked(self):
+        total = self.hits + self.misses
+        return {
+            "size": len(self._cache),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+            "persistent": self._db is not None,
+        }
+
+    def stats(self):
+        with self._lock:
+            return self._stats_locked()
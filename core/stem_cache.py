@@ -0,0 +1,40 @@
+from core.sqlite_cache import SqliteLRU
+
+DEFAULT_MAXSIZE = 50_000
+
+
+# ====== CACHE STEM (token -> kata dasar) ======
+# LRU terbatas di memori dengan counter hit/miss. Bila `path` diisi, hasil
+# stem juga ditulis ke tabel sqlite sehingga proses/worker baru langsung hangat.
+class StemCache(SqliteLRU):
+    NAME = "stem cache"
+    TABLE = "stems"
+    SCHEMA = "CREATE TABLE IF NOT EXISTS stems (token TEXT PRIMARY KEY, stem TEXT NOT NULL)"
+    INSERT = "INSERT OR REPLACE INTO stems (token, stem) VALUES (?, ?)"
+
+    def __init__(self, stemmer, maxsize=DEFAULT_MAXSIZE, path=None):
+        # CachedStemmer bawaan Sastrawi menyimpan semua kata tanpa batas;
+        # pakai stemmer di dalamnya supaya hanya cache ini yang menyimpan hasil.
+        self._stemmer = getattr(stemmer, "delegatedStemmer", stemmer)
+        super().__init__(maxsize, path)
+
+    def _load_rows(self, db):
+        return db.execute(
+            "SELECT token, stem FROM stems ORDER BY rowid DESC LIMIT ?", (self.maxsize,)
+        ).fetchall()
+
+    def _db_rows(self, pending):
+        return list(pending.items())
+
+    # ---- API seperti stemmer Sastrawi ----
+    def stem(self, word):
+        with self._lock:
+            stem = self._get_locked(word)
+        if stem is not None:
+            return stem
+
+        stem = self._stemmer.stem(word)
+
+        with self._lock:
+            self._put_locked(word, stem)
+        return stem
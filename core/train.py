@@ -0,0 +1,269 @@
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+from core import pipeline
+from core.export import sha256_file
+
+DEFAULT_CSV = "source/data-20rb.csv"
+TRAIN_MANIFEST = "train-manifest.json"
+CACHE_DIR = os.path.join(pipeline.BASE_DIR, ".cache", "train")
+
+# Parameter artefak fiks-1 (dibaca dari pickle yang dikirim di repo); yang
+# berbeda hanya tree_method "hist" dan n_jobs = semua core
+VECTORIZER_PARAMS = {
+    "binary": True, "ngram_range": (1, 3), "token_pattern": r"(?u)\b\w\w+\b",
+    "lowercase": True, "min_df": 4, "max_df": 0.7, "max_features": 25000,
+}
+XGB_PARAMS = {
+    "objective": "binary:logistic", "eval_metric": "logloss", "n_estimators": 300,
+    "learning_rate": 0.3, "max_depth": 6, "gamma": 0.2, "min_child_weight": 0,
+    "colsample_bylevel": 0.1, "subsample": 1, "scale_pos_weight": 1.5,
+    "random_state": 42, "tree_method": "hist",
+}
+# Keyword aduan: unigram yang muncul di >= KEYWORD_MIN_DOCS teks aduan dan
+# >= KEYWORD_MIN_PRECISION teks yang memuatnya berlabel aduan
+KEYWORD_MIN_DOCS = 5
+KEYWORD_MIN_PRECISION = 0.8
+
+
+# ====== WAKTU PER TAHAP ======
+class StageTimer:
+    def __init__(self, verbose=True):
+        self.stages = {}
+        self.verbose = verbose
+
+    @contextlib.contextmanager
+    def __call__(self, name):
+        if self.verbose:
+            print(f"[train] {name}...", file=sys.stderr, flush=True)
+        t0 = time.perf_counter()
+        yield
+        self.stages[name] = round(time.perf_counter() - t0, 3)
+        if self.verbose:
+            print(f"[train] {name}: {self.stages[name]:.2f} s", file=sys.stderr, flush=True)
+
+
+# ====== DATA ======
+def _labels(values):
+    import pandas as pd
+
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype(np.int8).to_numpy()
+    return (values.astype(str).str.strip().str.lower() == "aduan").to_numpy().astype(np.int8)
+
+
+def load_dataset(csv_path, text_column="text", label_column="label"):
+    import pandas as pd
+
+    df = pd.read_csv(csv_path, usecols=[text_column, label_column])
+    df = df.dropna(subset=[label_column])
+    return df[text_column].fillna("").astype(str).tolist(), _labels(df[label_column])
+
+
+# ====== CACHE PREPROCESSING ======
+# Token hasil preprocessing disimpan per (isi teks, konfigurasi preprocessing)
+# sebagai JSONL satu baris per teks; run berikutnya dengan data & spec
+# preprocessing yang sama melewati normalisasi + stem sepenuhnya.
+def preprocess_key(texts, spec):
+    h = hashlib.sha256()
+    config = {k: spec[k] for k in ("stem", "stopwords")}
+    h.update(json.dumps(config, sort_keys=True).encode())
+    h.update(sha256_file(pipeline.resolve_path(spec["slang"])).encode())
+    for text in texts:
+        h.update(text.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()[:32]
+
+
+def preprocess_cached(texts, spec, workers=None, cache_dir=CACHE_DIR):
+    from core.parallel import preprocess_parallel
+
+    path = os.path.join(cache_dir, f"tokens-{preprocess_key(texts, spec)}.jsonl")
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            tokens = [json.loads(line) for line in f]
+        if len(tokens) == len(texts):
+            return tokens, True
+    tokens = preprocess_parallel(texts, workers=workers)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(t, ensure_ascii=False) + "\n" for t in tokens)
+    os.replace(tmp, path)
+    return tokens, False
+
+
+# ====== KEYWORD ADUAN ======
+def derive_keywords(tokens, y, min_docs=KEYWORD_MIN_DOCS, min_precision=KEYWORD_MIN_PRECISION):
+    from collections import Counter
+
+    from core.preprocess import feature_tokens
+
+    in_aduan, total = Counter(), Counter()
+    for t, label in zip(tokens, y.tolist()):
+        words = set(feature_tokens(t))
+        total.update(words)
+        if label:
+            in_aduan.update(words)
+    return sorted(
+        w for w, n in in_aduan.items()
+        if n >= min_docs and n / total[w] >= min_precision
+    )
+
+
+def split_indices(y, valid_frac, seed=42):
+    # Split bertingkat (proporsi label sama di train & validasi)
+    rng = np.random.default_rng(seed)
+    valid = []
+    for label in (0, 1):
+        idx = np.flatnonzero(y == label)
+        rng.shuffle(idx)
+        valid.append(idx[:int(round(len(idx) * valid_frac))])
+    valid = np.sort(np.concatenate(valid))
+    train = np.setdiff1d(np.arange(len(y)), valid)
+    return train, valid
+
+
+# ====== PIPELINE TRAINING ======
+def train(csv_path, out_dir, version, text_column="text", label_column="label", valid_frac=0.2,
+          workers=None, n_jobs=None, keywords_path=None, verbose=True):
+    import joblib
+    import xgboost as xgb
+    from sklearn.feature_extraction.text import CountVectorizer
+
+    from core.evaluate import binary_metrics, save_evaluation
+    from core.export import write_native
+    from core.keywords import KeywordIndex, load_keywords, save_keywords
+    from core.vectorizer import VocabVectorizer
+
+    spec = pipeline.load_spec()
+    timer = StageTimer(verbose)
+    n_jobs = n_jobs or os.cpu_count()
+
+    with timer("load"):
+        texts, y = load_dataset(csv_path, text_column, label_column)
+    with timer("preprocess"):
+        tokens, cached = preprocess_cached(texts, spec, workers)
+    cleaned = [" ".join(t) for t in tokens]
+    train_idx, valid_idx = split_indices(y, valid_frac) if valid_frac else (np.arange(len(y)), None)
+
+    with timer("keywords"):
+        if keywords_path:
+            keywords = load_keywords(pipeline.resolve_path(keywords_path))
+        else:
+            keywords = derive_keywords([tokens[i] for i in train_idx], y[train_idx])
+    with timer("vectorize"):
+        vectorizer = CountVectorizer(**VECTORIZER_PARAMS)
+        vectorizer.fit([cleaned[i] for i in train_idx])
+        index = KeywordIndex(keywords, VocabVectorizer.from_sklearn(vectorizer))
+        X, _ = index.transform(tokens)
+        X = X.astype(np.float32)
+    with timer("fit"):
+        model = xgb.XGBClassifier(**XGB_PARAMS, n_jobs=n_jobs)
+        model.fit(X[train_idx], y[train_idx])
+
+    report, prob = {}, None
+    if valid_idx is not None and len(valid_idx):
+        with timer("evaluate"):
+            prob = model.predict_proba(X[valid_idx])[:, 1]
+            report = binary_metrics(y[valid_idx], prob, spec["threshold"])
+
+    with timer("write"):
+        os.makedirs(out_dir, exist_ok=True)
+        vec_path = os.path.join(out_dir, "vectorizer.pkl")
+        model_path = os.path.join(out_dir, "xgboost_model.pkl")
+        kw_path = os.path.join(out_dir, "aduan-keywords.txt")
+        joblib.dump(vectorizer, vec_path)
+        joblib.dump(model, model_path)
+        save_keywords(keywords, kw_path)
+        native_dir = os.path.join(out_dir, "native")
+        write_native(vectorizer, model.get_booster(), native_dir, {
+            "vectorizer.pkl": sha256_file(vec_path),
+            "xgboost_model.pkl": sha256_file(model_path),
+        })
+        # Probabilitas validasi + operating point ikut ekspor native (core.evaluate)
+        if prob is not None:
+            report["operating_point"] = save_evaluation(native_dir, y[valid_idx], prob, {
+                "path": csv_path, "sha256": sha256_file(csv_path), "split": "valid",
+                "rows": int(len(valid_idx)), "aduan": int(y[valid_idx].sum()),
+            }, version)["operating_point"]
+
+        # Spec siap pakai: salin ke model/pipeline.json untuk memakai model ini
+        def rel(path):
+            r = os.path.relpath(path, pipeline.BASE_DIR)
+            return os.path.abspath(path) if r.startswith("..") else r.replace(os.sep, "/")
+        new_spec = dict(spec, version=version, vectorizer=rel(vec_path), model=rel(model_path),
+                        native=rel(native_dir), keywords=rel(kw_path))
+        with open(os.path.join(out_dir, "pipeline.json"), "w", encoding="utf-8") as f:
+            json.dump(new_spec, f, indent=4, ensure_ascii=False)
+            f.write("\n")
+
+    manifest = {
+        "version": version,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "dataset": {
+            "path": csv_path,
+            "sha256": sha256_file(csv_path),
+            "rows": len(texts),
+            "aduan": int(y.sum()),
+            "train_rows": int(len(train_idx)),
+            "valid_rows": int(len(valid_idx)) if valid_idx is not None else 0,
+        },
+        "preprocess_cache_hit": cached,
+        "n_terms": len(vectorizer.vocabulary_),
+        "n_keywords": len(keywords),
+        "vectorizer_params": {k: list(v) if isinstance(v, tuple) else v for k, v in VECTORIZER_PARAMS.items()},
+        "xgb_params": dict(XGB_PARAMS, n_jobs=n_jobs),
+        "validation": report,
+        "stages_s": timer.stages,
+        "environment": {
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+            "xgboost": xgb.__version__,
+            "numpy": np.__version__,
+        },
+    }
+    with open(os.path.join(out_dir, TRAIN_MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=4)
+        f.write("\n")
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Latih ulang vectorizer, keyword aduan dan XGBoost dari CSV berlabel"
+    )
+    parser.add_argument("--csv", default=DEFAULT_CSV)
+    parser.add_argument("--text-column", default="text")
+    parser.add_argument("--label-column", default="label")
+    parser.add_argument("--version", default=time.strftime("train-%Y%m%d-%H%M%S"))
+    parser.add_argument("--out", help="folder artefak (default model/<version>)")
+    parser.add_argument("--valid-frac", type=float, default=0.2, help="porsi validasi (0 = latih semua)")
+    parser.add_argument("--keywords", help="pakai file keyword ini, bukan diturunkan dari data")
+    parser.add_argument("--workers", type=int, help="proses preprocessing")
+    parser.add_argument("--n-jobs", type=int, help="thread XGBoost (default semua core)")
+    args = parser.parse_args(argv)
+
+    csv_path = pipeline.resolve_path(args.csv)
+    if not os.path.exists(csv_path):
+        parser.error(f"dataset {csv_path} tidak ada")
+    out_dir = pipeline.resolve_path(args.out or os.path.join("model", args.version))
+    manifest = train(
+        csv_path, out_dir, args.version, args.text_column, args.label_column,
+        args.valid_frac, args.workers, args.n_jobs, args.keywords,
+    )
+    print(json.dumps({k: manifest[k] for k in ("version", "validation", "stages_s")}, indent=2))
+    print(f"[train] artefak di {out_dir}; salin {out_dir}/pipeline.json ke model/pipeline.json "
+          f"untuk memakainya", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import json
+import math
+import os
+
+import numpy as np
+
+# Di bawah jumlah baris ini evaluator NumPy lebih cepat dari DMatrix XGBoost
+AUTO_MAX_ROWS = 64
+CHUNK_ROWS = 128
+
+
+# ====== EKSPOR POHON XGBOOST -> ARRAY DATAR ======
+# Semua node dari semua pohon digabung: left/right (indeks global; daun menunjuk
+# dirinya sendiri), feature, threshold, default_left, value (nilai daun).
+# Aturan XGBoost: ke kiri bila x < threshold, fitur yang tidak ada di CSR =
+# missing -> ikut default_left.
+def trees_from_booster_json(raw):
+    learner = json.loads(raw)["learner"]
+    objective = learner["objective"]["name"]
+    model = learner["gradient_booster"]
+    if objective != "binary:logistic" or model["name"] != "gbtree":
+        raise ValueError(f"hanya gbtree + binary:logistic yang didukung ({model['name']}, {objective})")
+    model = model["model"]
+    if int(model["gbtree_model_param"]["num_parallel_tree"]) != 1 or set(model["tree_info"]) - {0}:
+        raise ValueError("model multi-class / random forest tidak didukung")
+
+    left, right, feature, threshold, default_left, value, roots = [], [], [], [], [], [], []
+    depth = 0
+    for tree in model["trees"]:
+        if any(tree["split_type"]):
+            raise ValueError("split kategorikal tidak didukung")
+        offset = len(left)
+        roots.append(offset)
+        lc, rc = tree["left_children"], tree["right_children"]
+        node_depth = [0] * len(lc)
+        for i, (l, r) in enumerate(zip(lc, rc)):
+            if l == -1:
+                left.append(offset + i)
+                right.append(offset + i)
+            else:
+                left.append(offset + l)
+                right.append(offset + r)
+                node_depth[l] = node_depth[r] = node_depth[i] + 1
+        depth = max(depth, max(node_depth))
+        feature.extend(tree["split_indices"])
+        threshold.extend(tree["split_conditions"])
+        default_left.extend(tree["default_left"])
+        value.extend(c if l == -1 else 0.0 for c, l in zip(tree["split_conditions"], lc))
+
+    params = learner["learner_model_param"]
+    return {
+        "left": np.asarray(left, dtype=np.int32),
+        "right": np.asarray(right, dtype=np.int32),
+        "feature": np.asarray(feature, dtype=np.int32),
+        "threshold": np.asarray(threshold, dtype=np.float32),
+        "default_left": np.asarray(default_left, dtype=bool),
+        "value": np.asarray(value, dtype=np.float32),
+        "roots": np.asarray(roots, dtype=np.int32),
+        "base_score": np.float32(params["base_score"]),
+        "n_features": np.int32(params["num_feature"]),
+        "max_depth": np.int32(depth),
+    }
+
+
+def save_trees(trees, path):
+    np.savez(path, **trees)
+
+
+def load_trees(path):
+    with np.load(path, allow_pickle=False) as f:
+        return {k: f[k] for k in f.files}
+
+
+# ====== EVALUATOR NUMPY ======
+# Semua pohon ditelusuri bersamaan (satu langkah per level), lalu nilai daun
+# dijumlahkan berurutan dalam float32 persis seperti predictor CPU XGBoost:
+# margin = base_margin + daun_0 + daun_1 + ... ; prob = sigmoid(margin).
+class TreeEnsemble:
+    def __init__(self, trees):
+        self.left = trees["left"]
+        self.right = trees["right"]
+        self.feature = trees["feature"]
+        self.threshold = trees["threshold"]
+        self.default_left = trees["default_left"]
+        self.value = trees["value"]
+        self.roots = trees["roots"]
+        self.max_depth = int(trees["max_depth"])
+        self.n_features_in_ = int(trees["n_features"])
+        # LogisticRegression::ProbToMargin di XGBoost: -logf(1/base - 1). np.log
+        # float32 bisa beda 1 ulp dari logf, jadi log dihitung double lalu dibulatkan.
+        base = np.float32(trees["base_score"])
+        self.base_margin = np.float32(-math.log(float(np.float32(1) / base - np.float32(1))))
+
+    def _leaves(self, dense):
+        # dense: (baris, fitur) float32, NaN = missing -> (baris, pohon) indeks daun.
+        # Dikerjakan datar: node[i] milik baris i // n_pohon.
+        n_rows, n_features = dense.shape
+        flat = dense.ravel()
+        offset = np.repeat(np.arange(n_rows) * n_features, len(self.roots))
+        node = np.tile(self.roots, n_rows)
+        for _ in range(self.max_depth):
+            x = flat[offset + self.feature[node]]
+            go_left = (x < self.threshold[node]) | (np.isnan(x) & self.default_left[node])
+            node = np.where(go_left, self.left[node], self.right[node])
+        return node.reshape(n_rows, len(self.roots))
+
+    def predict_margin(self, X):
+        if X.shape[1] != self.n_features_in_:
+            raise ValueError(f"X punya {X.shape[1]} fitur, model butuh {self.n_features_in_}")
+        X = X.tocsr()
+        out = np.empty(X.shape[0], dtype=np.float32)
+        for start in range(0, X.shape[0], CHUNK_ROWS):
+            part = X if X.shape[0] <= CHUNK_ROWS else X[start:start + CHUNK_ROWS]
+            dense = np.full(part.shape, np.nan, dtype=np.float32)
+            rows = np.repeat(np.arange(part.shape[0]), np.diff(part.indptr))
+            dense[rows, part.indices] = part.data
+            leaves = self.value[self._leaves(dense)]
+            margin = np.concatenate(
+                [np.full((leaves.shape[0], 1), self.base_margin, dtype=np.float32), leaves], axis=1
+            )
+            out[start:start + CHUNK_ROWS] = np.cumsum(margin, axis=1, dtype=np.float32)[:, -1]
+        return out
+
+    def predict_proba(self, X):
+        margin = self.predict_margin(X)
+        # common::Sigmoid XGBoost: 1 / (expf(min(-x, 88.7)) + 1); exp juga dihitung
+        # double lalu dibulatkan ke float32 agar sama dengan expf
+        e = np.exp(np.minimum(-margin, np.float32(88.7)).astype(np.float64)).astype(np.float32)
+        p = np.float32(1) / (e + np.float32(1))
+        return np.column_stack([1 - p, p])
+
+
+def load_tree_model(native_dir):
+    from core.export import load_manifest
+
+    manifest = load_manifest(native_dir)
+    if "trees" not in manifest:
+        raise ValueError(f"{native_dir}: ekspor belum berisi trees (jalankan ulang python -m core.export)")
+    return TreeEnsemble(load_trees(os.path.join(native_dir, manifest["trees"])))
+
+
+# ====== PILIH ENGINE PER UKURAN BATCH ======
+# "auto": NumPy untuk request kecil (halaman sentiment, micro-batch service),
+# XGBoost untuk batch besar. XGBoost baru di-import saat batch besar pertama.
+class AutoModel:
+    def __init__(self, small, load_large, max_rows=AUTO_MAX_ROWS):
+        self.small = small
+        self._load_large = load_large
+        self._large = None
+        self.max_rows = max_rows
+        self.n_features_in_ = small.n_features_in_
+
+    def predict_proba(self, X):
+        if X.shape[0] <= self.max_rows:
+            return self.small.predict_proba(X)
+        if self._large is None:
+            self._large = self._load_large()
+        return self._large.predict_proba(X)
@@ -0,0 +1,117 @@
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+DEFAULT_MAX_ENTRIES = 8
+DEFAULT_MAX_MB = 512
+
+
+def upload_key(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _nbytes(value):
+    # Future yang belum selesai dihitung 0; ukurannya ditambahkan begitu selesai
+    if isinstance(value, Future):
+        return _nbytes(value.result()) if value.done() and value.exception() is None else 0
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if hasattr(value, "memory_usage"):       # DataFrame
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, dict):
+        return sum(_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+# ====== CACHE HASIL UPLOAD (per isi file) ======
+# (versi pipeline, sha256 file) -> artefak halaman input: frame hasil skor,
+# ringkasan, PNG grafik, tabel duplikat dan CSV unduhan. Satu objek per proses
+# (registry), jadi dipakai bersama semua sesi Streamlit; rerun karena ganti
+# tab / klik download / upload file yang sama tidak mengklasifikasi ulang.
+# Dibatasi jumlah entri dan total ukuran (perkiraan), yang terlama dibuang dulu.
+# Artefak boleh berupa future (grafik/CSV yang masih dibuat di background):
+# entri langsung tersimpan, dibaca lewat dashboard.resolve, dan ukurannya
+# dihitung ulang tiap ada future yang selesai. Future yang gagal membuang entri.
+class UploadCache:
+    def __init__(self, version, max_entries=DEFAULT_MAX_ENTRIES, max_mb=DEFAULT_MAX_MB):
+        self.version = version
+        self.max_entries = max_entries
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache = OrderedDict()      # key -> (artefak, ukuran byte)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._cache.get((self.version, key))
+            if entry is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end((self.version, key))
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, artifacts):
+        size = _nbytes(artifacts)
+        if size > self.max_bytes:
+            return False
+        with self._lock:
+            old = self._cache.pop((self.version, key), None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._cache[(self.version, key)] = (artifacts, size)
+            self._bytes += size
+            self._evict_locked()
+        for value in artifacts.values():
+            if isinstance(value, Future):
+                value.add_done_callback(lambda f, k=(self.version, key), a=artifacts: self._settle(k, a, f))
+        return True
+
+    # Future artefak selesai: perbarui ukuran entri (atau buang bila gagal)
+    def _settle(self, cache_key, artifacts, future):
+        with self._lock:
+            entry = self._cache.get(cache_key)
+            if entry is None or entry[0] is not artifacts:
+                return
+            if future.cancelled() or future.exception() is not None:
+                del self._cache[cache_key]
+                self._bytes -= entry[1]
+                return
+            size = _nbytes(artifacts)
+            self._cache[cache_key] = (artifacts, size)
+            self._bytes += size - entry[1]
+            if size > self.max_bytes:
+                del self._cache[cache_key]
+                self._bytes -= size
+                self.evictions += 1
+            self._evict_locked()
+
+    def _evict_locked(self):
+        while len(self._cache) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, evicted) = self._cache.popitem(last=False)
+            self._bytes -= evicted
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._cache),
+                "mb": round(self._bytes / (1024 * 1024), 1),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
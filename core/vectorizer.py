@@ -0,0 +1,100 @@
+import re
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+
+# ====== VECTORIZER RINGAN DARI VOCABULARY ======
+# Pengganti CountVectorizer.transform untuk vocabulary tetap: token hasil
+# preprocessing langsung di-lookup ke indeks kolom, n-gram dirangkai di sini,
+# lalu CSR dibangun sekali per batch. Hasilnya sama persis dengan sklearn
+# (dtype data, indices/indptr int32, indeks terurut, nilai biner).
+class VocabVectorizer:
+    def __init__(self, vocabulary, ngram_range=(1, 1), token_pattern=r"(?u)\b\w\w+\b",
+                 lowercase=True, binary=False, dtype=np.int64):
+        if isinstance(vocabulary, dict):
+            self.vocabulary_ = vocabulary
+        else:
+            self.vocabulary_ = {t: i for i, t in enumerate(vocabulary)}
+        self.ngram_range = tuple(ngram_range)
+        self.token_pattern = token_pattern
+        self.lowercase = lowercase
+        self.binary = binary
+        self.dtype = np.dtype(dtype)
+        self._findall = re.compile(token_pattern).findall
+        self._n_features = len(self.vocabulary_)
+
+    @classmethod
+    def from_sklearn(cls, vectorizer):
+        return cls(
+            vectorizer.vocabulary_, vectorizer.ngram_range, vectorizer.token_pattern,
+            vectorizer.lowercase, vectorizer.binary, vectorizer.dtype,
+        )
+
+    # Salinan dengan istilah tambahan di kolom setelah vocabulary asli
+    def extended(self, terms):
+        vocabulary = dict(self.vocabulary_)
+        for t in terms:
+            if t in vocabulary:
+                raise ValueError(f"istilah {t!r} sudah ada di vocabulary")
+            vocabulary[t] = len(vocabulary)
+        return VocabVectorizer(
+            vocabulary, self.ngram_range, self.token_pattern,
+            self.lowercase, self.binary, self.dtype,
+        )
+
+    # Kata yang dilihat analyzer sklearn pada " ".join(tokens). Token tidak
+    # pernah berisi spasi kecuali hasil stem, dan findall per token memberi
+    # hasil yang sama dengan findall pada string gabungan.
+    def _words(self, tokens):
+        findall = self._findall
+        if self.lowercase:
+            return [w for t in tokens for w in findall(t.lower())]
+        return [w for t in tokens for w in findall(t)]
+
+    def _row(self, words):
+        vocab_get = self.vocabulary_.get
+        binary = self.binary
+        min_n, max_n = self.ngram_range
+        counts = {}
+        n_words = len(words)
+        for n in range(min_n, min(max_n, n_words) + 1):
+            if n == 1:
+                grams = words
+            else:
+                grams = [" ".join(words[i:i + n]) for i in range(n_words - n + 1)]
+            for g in grams:
+                j = vocab_get(g)
+                if j is not None:
+                    counts[j] = 1 if binary else counts.get(j, 0) + 1
+        return counts
+
+    def _build(self, word_lists):
+        indptr = [0]
+        indices = []
+        values = []
+        for words in word_lists:
+            counts = self._row(words)
+            cols = sorted(counts)
+            indices.extend(cols)
+            values.extend(counts[j] for j in cols)
+            indptr.append(len(indices))
+
+        idx_dtype = np.int32 if indptr[-1] <= np.iinfo(np.int32).max else np.int64
+        X = csr_matrix(
+            (np.asarray(values, dtype=self.dtype),
+             np.asarray(indices, dtype=idx_dtype), np.asarray(indptr, dtype=idx_dtype)),
+            shape=(len(indptr) - 1, self._n_features),
+        )
+        X.has_sorted_indices = True
+        return X
+
+    # Batch token preprocessing (list of list of str) -> CSR
+    def transform_tokens(self, token_lists):
+        return self._build(self._words(t) for t in token_lists)
+
+    # Kompatibel dengan CountVectorizer.transform (input string mentah)
+    def transform(self, raw_documents):
+        if isinstance(raw_documents, str):
+            raise ValueError("Iterable over raw text documents expected, string object received.")
+        return self._build(self._words([doc]) for doc in raw_documents)
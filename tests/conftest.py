@@ -0,0 +1,30 @@
+import pytest
+
+from core.loadgen import SAMPLE_TEXTS
+from core.preprocess import PARITY_CASES
+
+# Baris contoh (gaya data-20rb.csv) + kasus tanda baca/slang core.preprocess
+ROWS = [
+    "min jalan di depan pasar wonokromo berlubang besar, tlg segera diperbaiki",
+    "lampu lalu lintas di perempatan mati dr pagi, macet parah!!",
+    "jembatan di kali mas sudah retak2 gt, bahaya buat motor",
+    "trotoar jl. tunjungan rusak & dipakai pkl... pejalan kaki terpaksa lewat aspal",
+    "rambu dilarang parkir tertutup pohon, jd banyak yg parkir sembarangan",
+    "terima kasih dishub, angkot skrg lebih tertib 👍",
+    "Selamat malam, info arus mudik tol waru-sidoarjo ramai lancar ya",
+    "aspal baru seminggu udh mengelupas, kualitas apa ini?",
+]
+
+
+@pytest.fixture(scope="session")
+def texts():
+    return list(SAMPLE_TEXTS) + PARITY_CASES + ROWS
+
+
+@pytest.fixture(scope="session")
+def tokens(texts):
+    from core import registry
+    from core.preprocess import preprocess_tokens
+
+    stemmer = registry.get_stemmer() if registry.get_spec()["stem"] else None
+    return [preprocess_tokens(t, registry.get_normalizer(), stemmer) for t in texts]
@@ -0,0 +1,18 @@
+import numpy as np
+
+from core import dashboard, registry
+
+
+# Acuan label_frequencies: baris tiap label dipilih mask lalu dijumlahkan
+def _frequencies(X, terms, mask, top=dashboard.WORDCLOUD_MAX_WORDS):
+    return dashboard._top(np.asarray(X[np.flatnonzero(mask)].sum(axis=0)).ravel(), terms, top)
+
+
+def test_label_frequencies_same_as_masked_sum(texts):
+    cleaned = [" ".join(registry.get_normalizer().tokens(t)) for t in texts] * 3
+    labels = np.array(["aduan", "bukan aduan"] * (len(cleaned) // 2) + ["aduan"] * (len(cleaned) % 2))
+    X, terms = dashboard.term_matrix(cleaned)
+    got = dashboard.label_frequencies(X, terms, labels)
+    for label in dashboard.LABELS:
+        assert got[label] == _frequencies(X, terms, labels == label)
+        assert list(got[label].items())[:5] == list(_frequencies(X, terms, labels == label, top=5).items())
@@ -0,0 +1,11 @@
+from core import pipeline
+from core.export import verify
+
+
+def test_native_export_same_as_pickle(texts):
+    spec = pipeline.load_spec()
+    result = verify(spec, pipeline.resolve_path(spec["native"]), texts)
+    assert result["rows"] == len(texts)
+    assert result["stale_sources"] == []
+    assert result["same_matrix"]
+    assert result["max_abs_diff"] == 0.0
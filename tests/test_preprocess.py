@@ -0,0 +1,6 @@
+from core import registry
+from core.preprocess import check_parity
+
+
+def test_normalizer_matches_nltk(texts):
+    assert check_parity(texts, registry.get_slang_dict(), registry.get_stop_words()) == []
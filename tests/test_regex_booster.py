@@ -0,0 +1,18 @@
+import numpy as np
+
+from core import pipeline
+from core.regex_booster import DEFAULT_MAX_GAP, NaiveBooster, RegexBooster, load_patterns
+
+
+def test_regex_booster_same_as_naive(texts):
+    cfg = pipeline.load_spec().get("booster") or {}
+    patterns = load_patterns(pipeline.resolve_path(cfg.get("path", "source/booster.json")))
+    max_gap = cfg.get("max_gap", DEFAULT_MAX_GAP)
+    fast, naive = RegexBooster(patterns, max_gap), NaiveBooster(patterns, max_gap)
+    hits = [fast.hits(t) for t in texts]
+    assert hits == [naive.hits(t) for t in texts]
+    assert sum(map(bool, hits)) >= 5
+    expected = np.zeros((len(texts), fast.n_rules), dtype=np.int8)
+    for i, h in enumerate(hits):
+        expected[i, h] = 1
+    assert np.array_equal(fast.hit_matrix(texts).toarray(), expected)
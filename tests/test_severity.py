@@ -0,0 +1,14 @@
+import math
+
+import numpy as np
+
+from core import registry
+
+
+def test_neutral_text_scores_plain_zero():
+    scorer = registry.get_severity_scorer()
+    assert scorer is not None
+    scores = scorer.score(["zzqx", "", "jalan rusak parah"])
+    assert scores[0] == 0.0 and math.copysign(1.0, scores[0]) == 1.0
+    assert math.copysign(1.0, scores[1]) == 1.0
+    assert not np.signbit(scorer.score_tokens([["zzqx"]])).any()
@@ -0,0 +1,13 @@
+import numpy as np
+
+from core import pipeline, registry
+from core.export import load_native_model, load_native_vectorizer
+from core.keywords import KeywordIndex
+from core.tree_engine import load_tree_model
+
+
+def test_tree_engine_exact(tokens):
+    native_dir = pipeline.resolve_path(pipeline.load_spec()["native"])
+    X, _ = KeywordIndex(registry.get_aduan_keywords(), load_native_vectorizer(native_dir)).transform(tokens)
+    expected = load_native_model(native_dir).predict_proba(X)[:, 1]
+    assert np.array_equal(load_tree_model(native_dir).predict_proba(X)[:, 1], expected)
@@ -0,0 +1,12 @@
+import joblib
+
+from core import pipeline
+from core.export import same_matrix
+from core.vectorizer import VocabVectorizer
+
+
+def test_vocab_vectorizer_same_as_sklearn(tokens):
+    sk = joblib.load(pipeline.resolve_path(pipeline.load_spec()["vectorizer"]))
+    expected = sk.transform([" ".join(t) for t in tokens])
+    assert expected.nnz
+    assert same_matrix(VocabVectorizer.from_sklearn(sk).transform_tokens(tokens), expected)
@@ -1,6 +1,9 @@
 import streamlit as st
+import os
 import pandas as pd
 
+from core import dashboard, registry
+
 def app():
 
     COLOR_PRIMARY = "#45607c"   # Biru navy muted
@@ -152,18 +155,81 @@ def app():
 
     # ======= DATASET & EVALUASI =======
     st.markdown('<div class="section-title">Informasi Dataset & Evaluasi Model</div>', unsafe_allow_html=True)
-    df = pd.read_csv("source/data-20rb.csv")
-    df_display = df.drop(columns=["is_aduan", "text_clean"], errors="ignore")
-    with st.expander("📊 Tampilkan Data Aduan (20.000+ tweet)", expanded=False):
-        st.dataframe(df_display, use_container_width=True)
-        csv = df_display.to_csv(index=False).encode("utf-8")
-        st.download_button(
-            "⬇️ Download Dataset (CSV)", 
-            csv, "dataset.csv", mime="text/csv", 
-            help="Unduh data aduan untuk eksplorasi lebih lanjut."
+    # Dataset dibaca dari Arrow memory-mapped (core.dataset): hanya halaman
+    # yang tampil yang diambil, filter & pilihan kolom dihitung di server
+    data = registry.get_dataset()
+    if data is None:
+        st.info("Dataset belum tersedia (source/data-20rb.csv).")
+    else:
+        with st.expander(f"📊 Tampilkan Data Aduan ({data.n_rows:,} tweet)", expanded=False):
+            c1, c2, c3 = st.columns([2, 1, 2])
+            query = c1.text_input("Cari teks", key="data_query").strip()
+            filters = {}
+            if "label" in data.columns:
+                label = c2.selectbox("Label", ["Semua"] + data.values("label"), key="data_label")
+                if label != "Semua":
+                    filters["label"] = label
+            columns = c3.multiselect("Kolom", data.columns, default=data.columns, key="data_columns")
+            n_rows = data.count(query, filters)
+            pages = dashboard.n_pages(n_rows)
+            # Key ikut filter: ganti filter kembali ke halaman 1
+            page = st.number_input(f"Halaman (1-{pages})", 1, pages, 1, key=f"data_page:{query}:{filters}")
+            st.caption(f"{n_rows:,} baris cocok")
+            st.dataframe(
+                data.page(page, dashboard.PAGE_SIZE, columns or None, query, filters),
+                use_container_width=True,
+            )
+            # CSV disiapkan sekali saat konversi; dengan static serving browser
+            # mengunduhnya langsung dari file tanpa lewat memori aplikasi
+            name = os.path.basename(data.csv_path)
+            if st.get_option("server.enableStaticServing"):
+                st.markdown(
+                    f'<a href="app/static/dataset/{name}" download="dataset.csv">⬇️ Download Dataset (CSV)</a>',
+                    unsafe_allow_html=True,
+                )
+            else:
+                with open(data.csv_path, "rb") as f:
+                    st.download_button(
+                        "⬇️ Download Dataset (CSV)",
+                        f, "dataset.csv", mime="text/csv",
+                        help="Unduh data aduan untuk eksplorasi lebih lanjut."
+                    )
+
+    # ======= EVALUASI LIVE MODEL TERPASANG =======
+    # Dari probabilitas tersimpan (python -m core.evaluate); geser threshold
+    # cukup membaca baris kurva yang sudah dihitung, tanpa prediksi ulang
+    st.markdown("#### Evaluasi Model Terpasang", unsafe_allow_html=True)
+    evaluation = registry.get_evaluation()
+    if evaluation is None:
+        st.info("Belum ada hasil evaluasi. Jalankan `python -m core.evaluate --csv <data berlabel>` sekali.")
+    else:
+        spec = registry.get_spec()
+        info = evaluation.info
+        st.caption(
+            f"{info['dataset']['rows']:,} tweet berlabel ({info['dataset']['aduan']:,} aduan) · "
+            f"pipeline {info['pipeline_version']} · ROC AUC {evaluation.auc:.3f} · "
+            f"operating point ({info['operating_point']['objective']}) {evaluation.operating_point:.3f} · "
+            f"threshold aktif {spec['threshold']}"
         )
+        if info["pipeline_version"] != spec["version"]:
+            st.warning(f"Hasil evaluasi dari pipeline {info['pipeline_version']}, "
+                       f"pipeline aktif {spec['version']}.")
+        threshold = st.slider("Threshold aduan", 0.0, 1.0, float(spec["threshold"]), 0.01, key="eval_threshold")
+        m = evaluation.at(threshold)
+        cols = st.columns(4)
+        for col, (name, key) in zip(cols, [("Accuracy", "accuracy"), ("Precision", "precision"),
+                                           ("Recall", "recall"), ("F1-Score", "f1")]):
+            col.metric(name, f"{m[key]:.2f}")
+        c = m["confusion"]
+        st.markdown("<b>Confusion Matrix</b>", unsafe_allow_html=True)
+        st.table(pd.DataFrame(
+            {"Prediksi Bukan Aduan": [c["tn"], c["fn"]], "Prediksi Aduan": [c["fp"], c["tp"]]},
+            index=["Bukan Aduan", "Aduan"],
+        ))
+        st.image(evaluation.curves_png(), use_container_width=True)
 
     # ======= data tabel =======
+    st.markdown("#### Perbandingan Model (hasil penelitian)", unsafe_allow_html=True)
     dummy_reports = {
         "CountVectorizer + XGBoost": pd.DataFrame({
             "": ["Bukan Aduan","Aduan","Accuracy"],
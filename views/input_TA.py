@@ -1,68 +1,15 @@
+import io
+
 import streamlit as st
 import pandas as pd
 import numpy as np
-import joblib
-import re
-from nltk.tokenize import word_tokenize
-from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
-from nltk.corpus import stopwords
-from scipy.sparse import hstack
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
 
-def app():
-    # ==== Load model & asset ====
-    vectorizer = joblib.load("model/vectorizer-fiks-1.pkl")
-    xgb_model  = joblib.load("model/xgboost_model-fiks-1.pkl")
-    aduan_keywords = set(np.load(
-        "model/aduan-keywordS.npy",
-        allow_pickle=True
-    ))
-
-    THRESHOLD = 0.4
-
-    @st.cache_data
-    def load_slang_dict():
-        slang = {}
-        try:
-            with open("source/slang-kamus.txt", "r", encoding="utf-8") as f:
-                for line in f:
-                    k, v = line.strip().split(":")
-                    slang[k] = v
-        except:
-            pass
-        return slang
-
-    slang_dict = load_slang_dict()
-    stemmer = StemmerFactory().create_stemmer()
-    stop_words = set(stopwords.words("indonesian")) | set(stopwords.words("english"))
-    stop_words.update(["iya", "lalu", "lintas", "hambatan"])   
-    stop_words -= {"tidak", "macet", "jalan"} 
-
-    # ==== Preprocessing untuk ML ===================================
-    def normalize_slang(text: str) -> str:
-        return " ".join(slang_dict.get(w, w) for w in word_tokenize(text.lower()))
-
-    def preprocess_text(text: str) -> str:
-        t = normalize_slang(text)
-        t = re.sub(r'[^\w\s]', '', t)
-        t = re.sub(r'\d+', '', t)
-        tokens = [w for w in word_tokenize(t) if w not in stop_words]
-        return " ".join(tokens)
-
-    def is_keyword_aduan(tclean: str) -> int:
-        return int(bool(set(word_tokenize(tclean)) & aduan_keywords))
-
-    # ==== Prediksi MODEL XGBoost ==========
-    def predict_aduan(text: str):
-        clean = preprocess_text(text)
-        X_vec = vectorizer.transform([clean])
-        X_key = np.array([is_keyword_aduan(clean)]).reshape(-1,1)
-        X     = hstack([X_vec, X_key])
-        prob  = xgb_model.predict_proba(X)[0,1]
-        lbl   = int(prob >= THRESHOLD)
-        return lbl, prob
+from core import dashboard, metrics, registry
+from core.inference import predict_batch, severity_scores
+from core.parallel import stem_cache_stats
+from core.upload_cache import upload_key as file_key
 
+def app():
     # ====== METRIC CARD ============
     def metric_card(title, value, delta=None, color="#316398"):
         st.markdown(f"""
@@ -81,6 +28,20 @@ def app():
             </div>
         """, unsafe_allow_html=True)
 
+    # ====== TABEL BERHALAMAN ======
+    # Hanya satu halaman yang dikirim ke browser, bukan seluruh baris upload
+    def paged_table(frame, key, height=None, style=None):
+        pages = dashboard.n_pages(len(frame))
+        page = 1
+        if pages > 1:
+            page = st.number_input(
+                f"Halaman (1-{pages}) · {len(frame):,} baris", min_value=1, max_value=pages,
+                value=1, step=1, key=key
+            )
+        part = dashboard.page_slice(frame, page)
+        st.dataframe(style(part) if style else part, height=height,
+                     use_container_width=True, hide_index=True)
+
     # ====== HEADER ======
     st.markdown("""
         <style>
@@ -98,121 +59,169 @@ def app():
     # ====== UPLOAD & PROCESS ======
     up = st.file_uploader("📂 Pilih file CSV...", type=["csv"])
     if up:
-        df = pd.read_csv(up)
-        if "text" not in df.columns:
-            st.error("Kolom `text` tidak ditemukan.")
-            return
-
-        with st.spinner("🔎 Memproses..."):
-            def apply_pred(r):
-                lbl, pr = predict_aduan(r["text"])
-                return pd.Series({
-                    "text_cleaned": preprocess_text(r["text"]),
-                    "prob_aduan":  pr,
-                    "label":       "aduan" if lbl==1 else "bukan aduan"
-                })
-            df[["text_cleaned","prob_aduan","label"]] = df.apply(apply_pred, axis=1)
-        st.success("✅ Klasifikasi selesai!")
+        # Hasil per isi file (sha256) disimpan di cache upload bersama begitu skor
+        # selesai (grafik/CSV masih berupa future): rerun karena ganti tab, halaman
+        # tabel atau klik download tidak mengklasifikasi ulang
+        data = up.getvalue()
+        upload_cache = registry.get_upload_cache()
+        upload_key = file_key(data)
+        art = upload_cache.get(upload_key)
+        fresh = art is None
+
+        if fresh:
+            df = pd.read_csv(io.BytesIO(data))
+            if "text" not in df.columns:
+                st.error("Kolom `text` tidak ditemukan.")
+                return
+
+            trace = metrics.begin_trace("upload", rows=len(df))
+            with st.spinner("🔎 Memproses..."):
+                # Satu batch: teks duplikat & yang sudah pernah diproses diambil dari
+                # result cache, sisanya preprocessing paralel + predict_proba per chunk
+                cleaned, prob, lbl = predict_batch(df["text"].fillna("").astype(str))
+                df["text_cleaned"] = cleaned
+                df["prob_aduan"]   = prob
+                df["label"]        = np.where(lbl == 1, "aduan", "bukan aduan")
+                severity = severity_scores(cleaned)
+                if severity is not None:
+                    df["severity"] = severity
+
+            # Grafik, duplikat & CSV disiapkan di background; metric card dan tabel
+            # tampil lebih dulu, lalu tiap bagian mengisi tempatnya begitu selesai
+            s = dashboard.summary(df)
+            dup_cfg = registry.get_spec().get("near_duplicates") or {}
+            art = {
+                "df": df,
+                "summary": s,
+                "unique": df["text_cleaned"].nunique(),
+                "pie": dashboard.submit(dashboard.donut_png, s["aduan"], s["bukan"]),
+                "clouds": dashboard.submit(
+                    dashboard.wordcloud_pngs, df["text_cleaned"].tolist(), df["label"].to_numpy()
+                ),
+                "dup": dashboard.submit(
+                    dashboard.duplicates, df[["text", "text_cleaned", "label"]], dup_cfg.get("threshold")
+                ),
+                "csv": dashboard.submit(dashboard.csv_bytes, df),
+            }
+            upload_cache.put(upload_key, art)
+            st.success("✅ Klasifikasi selesai!")
+            cache = registry.get_result_cache().stats()
+            st.caption(
+                f"♻️ {art['unique']:,} teks bersih unik dari {len(df):,} baris · "
+                f"hit rate cache hasil {cache['hit_rate']:.0%} ({cache['size']:,} entri)"
+            )
+        else:
+            trace = None
+            df, s = art["df"], art["summary"]
+            st.success("✅ Klasifikasi selesai!")
+            st.caption(
+                f"⚡ File ini sudah pernah diproses, hasil diambil dari cache upload · "
+                f"{art['unique']:,} teks bersih unik dari {len(df):,} baris"
+            )
 
         # ====== METRICS ======
-        n1 = (df.label=="aduan").sum()
-        n2 = (df.label=="bukan aduan").sum()
-        tot = len(df)
-        aw  = int(df.text.str.split().str.len().mean())
-
         c1, c2, c3, c4 = st.columns(4)
-        with c1: metric_card("Total Data", tot, color="#316398")
-        with c2: metric_card("Aduan", n1, color="#DE4C4A")
-        with c3: metric_card("Bukan Aduan", n2, color="#48A14D")
-        with c4: metric_card("Rata-rata Kata", aw, color="#316398")
+        with c1: metric_card("Total Data", s["total"], color="#316398")
+        with c2: metric_card("Aduan", s["aduan"], color="#DE4C4A")
+        with c3: metric_card("Bukan Aduan", s["bukan"], color="#48A14D")
+        with c4: metric_card("Rata-rata Kata", s["avg_words"], color="#316398")
 
         # ====== DISTRIBUSI & CONTOH KALIMAT ======
         col1, col2 = st.columns(2)
         with col1:
             st.markdown("### 📊 Distribusi Aduan vs Bukan")
-            fig, ax = plt.subplots(figsize=(3, 3))
-            wedges, _, autotxt = ax.pie(
-                [n1, n2],
-                labels=["Aduan", "Bukan"],
-                autopct="%1.1f%%",
-                startangle=120,
-                colors=["#DE4C4A", "#A1D48F"],
-                explode=(0.05, 0.05),
-                wedgeprops={"edgecolor": "#fff", "linewidth": 1.5},
-                textprops={"fontsize": 12, "weight": "bold"}
-            )
-            for t in autotxt:
-                t.set_color("#333")
-            ax.add_artist(plt.Circle((0, 0), 0.65, fc="white", linewidth=1.2, edgecolor="#ececec"))
-            ax.axis("equal")
-            st.pyplot(fig)
+            pie_slot = st.empty()
 
-        with col2:
+        with col2, metrics.timer("render.examples"):
             st.markdown("### 🧾 Contoh Kalimat", unsafe_allow_html=True)
             tab1, tab2 = st.tabs(["Aduan", "Bukan Aduan"])
+            # Kolom severity (leksikon) ikut tampil bila aktif; aduan diurutkan dari yang paling mendesak
+            cols = ["text", "label"] + (["severity"] if "severity" in df else [])
+            names = ["Contoh Kalimat", "Label"] + (["Severity"] if "severity" in df else [])
             with tab1:
-                df_aduan = df[df.label=="aduan"][["text","label"]]
-                df_aduan.columns = ["Contoh Kalimat","Label"]
-                st.dataframe(df_aduan, height=250, use_container_width=True, hide_index=True)
+                df_aduan = df[df.label=="aduan"][cols]
+                if "severity" in df:
+                    df_aduan = df_aduan.sort_values("severity", ascending=False, kind="stable")
+                df_aduan.columns = names
+                paged_table(df_aduan, "page_aduan", height=250)
             with tab2:
-                df_bukan = df[df.label=="bukan aduan"][["text","label"]]
-                df_bukan.columns = ["Contoh Kalimat","Label"]
-                st.dataframe(df_bukan, height=250, use_container_width=True, hide_index=True)
+                df_bukan = df[df.label=="bukan aduan"][cols]
+                df_bukan.columns = names
+                paged_table(df_bukan, "page_bukan", height=250)
 
         # ====== WORDCLOUD ======
         st.markdown("### ☁️ WordCloud", unsafe_allow_html=True)
         wc1, wc2 = st.columns(2)
         with wc1:
             st.write("Aduan")
-            ad_text = " ".join(df[df.label=="aduan"]["text_cleaned"])
-            if ad_text:
-                wc = WordCloud(width=400, height=200, background_color='white')\
-                    .generate(ad_text)
-                fig, ax = plt.subplots(figsize=(6,3))
-                ax.imshow(wc); ax.axis("off")
-                st.pyplot(fig)
+            wc_aduan = st.empty()
         with wc2:
             st.write("Bukan Aduan")
-            nonad_text = " ".join(df[df.label=="bukan aduan"]["text_cleaned"])
-            if nonad_text:
-                wc = WordCloud(width=400, height=200, background_color='white')\
-                    .generate(nonad_text)
-                fig, ax = plt.subplots(figsize=(6,3))
-                ax.imshow(wc); ax.axis("off")
-                st.pyplot(fig)
+            wc_bukan = st.empty()
+
+        pie_slot.image(dashboard.resolve(art["pie"]))
+        clouds = dashboard.resolve(art["clouds"])
+        if clouds["aduan"]:
+            wc_aduan.image(clouds["aduan"], use_container_width=True)
+        if clouds["bukan aduan"]:
+            wc_bukan.image(clouds["bukan aduan"], use_container_width=True)
 
         # ====== DUPLIKAT ======
         st.markdown("### 🔁 Duplikat", unsafe_allow_html=True)
-        dup = (
-            df.groupby('text_cleaned')
-                .agg(Text_Asli=('text','first'),
-                    Label=('label','first'),
-                    Jumlah_Duplikat=('text','count'))
-                .query('Jumlah_Duplikat>1')
-                .reset_index()
-                .rename(columns={'text_cleaned':'Contoh Kalimat'})
-        )
+        dup = dashboard.resolve(art["dup"])
         if not dup.empty:
-            st.warning(f"🚨 {len(dup)} kalimat berulang", icon="♻️")
+            st.warning(
+                f"🚨 {len(dup)} kelompok kalimat berulang / hampir sama "
+                f"({dup['Jumlah_Duplikat'].sum():,} baris)", icon="♻️"
+            )
             def style_lbl(v):
                 c = '#48A14D' if v=='aduan' else '#DE4C4A'
                 return f'background:{c}22; color:{c}; font-weight:600;'
-            st.dataframe(dup.style.applymap(style_lbl, subset=['Label']),
-                            use_container_width=True, hide_index=True)
+            paged_table(dup, "page_dup", style=lambda page: page.style.map(style_lbl, subset=['Label']))
         else:
             st.info("Tidak ada duplikat.")
 
         # ====== DOWNLOAD ======
         st.markdown("### ⬇️ Unduh Hasil", unsafe_allow_html=True)
-        download_df = df[["text", "text_cleaned", "label"]]
-        csv_data = download_df.to_csv(index=False).encode("utf-8")
         st.download_button(
             label="Download CSV",
-            data=csv_data,
+            data=dashboard.resolve(art["csv"]),
             file_name="hasil_sederhana.csv",
             mime="text/csv"
         )
 
+        # ====== DIAGNOSTIK ======
+        metrics.end_trace(trace)
+        with st.expander("🩺 Diagnostik (waktu per tahap)"):
+            if not fresh:
+                u = upload_cache.stats()
+                st.caption(
+                    f"Hasil dari cache upload ({u['size']} file, {u['mb']} MB, "
+                    f"hit rate {u['hit_rate']:.0%}); tidak ada tahap yang dijalankan ulang."
+                )
+            elif trace is None:
+                st.caption("Metrik dimatikan (ADUAN_METRICS=0).")
+            else:
+                st.caption(f"Total {trace.elapsed * 1000:,.0f} ms untuk {len(df):,} baris")
+                st.dataframe(pd.DataFrame(trace.rows()), use_container_width=True, hide_index=True)
+                stem = stem_cache_stats()
+                if stem is not None:
+                    st.caption(
+                        f"Cache stem (proses ini + worker): hit rate {stem['hit_rate']:.0%} "
+                        f"({stem['hits']:,} hit, {stem['misses']:,} dipanggil ke Sastrawi)"
+                    )
+                loads = {
+                    k: v for k, v in metrics.snapshot()["stages"].items() if k.startswith("load.")
+                }
+                if loads:
+                    st.caption("Load model/asset (sekali per proses):")
+                    st.dataframe(
+                        pd.DataFrame(
+                            [{"asset": k[5:], "ms": round(v["sum_s"] * 1000, 1)} for k, v in loads.items()]
+                        ),
+                        use_container_width=True, hide_index=True
+                    )
+
     else:
         st.info(
             "📂 Pastikan file CSV Anda memiliki:\n"